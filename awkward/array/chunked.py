@@ -754,3 +754,132 @@ class AppendableArray(ChunkedArray):
             self._chunks[-1][self._counts[-1] : self._counts[-1] + howmany] = values[:howmany]
             self._counts[-1] += howmany
             values = values[howmany:]
+
+    def snapshot(self):
+        chunks = [x[:c] for x, c in zip(self._chunks, self._counts) if c > 0]
+        if len(chunks) == 0:
+            return awkward.util.numpy.empty((0,) + self._chunkshape[1:], dtype=self._dtype)
+        elif len(chunks) == 1:
+            return chunks[0]
+        else:
+            return ChunkedArray(chunks, [len(x) for x in chunks])
+
+################################################################ appendable builders
+
+def _reserve(array, length, needed):
+    # double the capacity until needed fits, preserving the first length items; earlier views keep the old array
+    if needed <= len(array):
+        return array
+    capacity = max(len(array), 1)
+    while capacity < needed:
+        capacity *= 2
+    out = awkward.util.numpy.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    out[:length] = array[:length]
+    return out
+
+class AppendableJaggedArray(object):
+    """
+    AppendableJaggedArray
+    """
+
+    def __init__(self, dtype=awkward.util.DEFAULTTYPE, capacity=1024):
+        self._offsets = awkward.util.numpy.zeros(max(capacity, 1) + 1, dtype=awkward.util.INDEXTYPE)
+        self._content = awkward.util.numpy.empty(max(capacity, 1), dtype=dtype)
+        self._length = 0
+
+    @property
+    def dtype(self):
+        return self._content.dtype
+
+    def __len__(self):
+        return self._length
+
+    def append(self, value):
+        value = awkward.util.numpy.asarray(value, dtype=self._content.dtype)
+        if len(value.shape) != 1:
+            raise ValueError("AppendableJaggedArray items must be one-dimensional")
+        start = self._offsets[self._length]
+        stop = start + len(value)
+        self._content = _reserve(self._content, start, stop)
+        self._content[start:stop] = value
+        self._offsets = _reserve(self._offsets, self._length + 1, self._length + 2)
+        self._offsets[self._length + 1] = stop
+        self._length += 1
+
+    def extend(self, values):
+        import awkward.array.jagged
+        if not isinstance(values, awkward.array.jagged.JaggedArray):
+            for x in values:
+                self.append(x)
+            return
+
+        start = self._offsets[self._length]
+        content = values.flatten()
+        self._content = _reserve(self._content, start, start + len(content))
+        self._content[start : start + len(content)] = content
+        self._offsets = _reserve(self._offsets, self._length + 1, self._length + 1 + len(values))
+        self._offsets[self._length + 1 : self._length + 1 + len(values)] = start + awkward.util.numpy.cumsum(values.counts)
+        self._length += len(values)
+
+    def snapshot(self):
+        import awkward.array.jagged
+        offsets = self._offsets[:self._length + 1]
+        return awkward.array.jagged.JaggedArray.fromoffsets(offsets, self._content[:offsets[-1]])
+
+class AppendableTable(object):
+    """
+    AppendableTable
+    """
+
+    def __init__(self, dtype, capacity=1024):
+        dtype = awkward.util.numpy.dtype(dtype)
+        if dtype.names is None:
+            raise TypeError("dtype must be a structured dtype, with a field for each column")
+        self._columns = awkward.util.OrderedDict((n, awkward.util.numpy.empty(max(capacity, 1), dtype=dtype[n])) for n in dtype.names)
+        self._length = 0
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    def __len__(self):
+        return self._length
+
+    def append(self, value):
+        import awkward.array.table
+        if isinstance(value, awkward.array.table.Table.Row):
+            value = dict((n, value[n]) for n in self._columns)
+        elif isinstance(value, awkward.util.numpy.void):
+            value = tuple(value)
+        if isinstance(value, tuple) and len(value) != len(self._columns):
+            raise ValueError("row has {0} fields but AppendableTable has {1} columns".format(len(value), len(self._columns)))
+
+        for i, (n, x) in enumerate(self._columns.items()):
+            x = self._columns[n] = _reserve(x, self._length, self._length + 1)
+            x[self._length] = value[i] if isinstance(value, tuple) else value[n]
+        self._length += 1
+
+    def extend(self, values):
+        import awkward.array.table
+        if isinstance(values, awkward.util.numpy.ndarray) and values.dtype.names is not None or isinstance(values, (awkward.array.table.Table, dict)):
+            length = None
+            for n in self._columns:
+                if length is None:
+                    length = len(values[n])
+                elif len(values[n]) != length:
+                    raise ValueError("columns of different lengths")
+            for n, x in self._columns.items():
+                x = self._columns[n] = _reserve(x, self._length, self._length + length)
+                x[self._length : self._length + length] = values[n][:length]
+            self._length += length
+
+        else:
+            for x in values:
+                self.append(x)
+
+    def snapshot(self):
+        import awkward.array.table
+        out = awkward.array.table.Table()
+        for n, x in self._columns.items():
+            out[n] = x[:self._length]
+        return out
@@ -28,8 +28,9 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import pickle
+import itertools
 import numbers
+import pickle
 
 import awkward.array.base
 import awkward.persist
@@ -155,16 +156,50 @@ class IndexedArray(awkward.array.base.AwkwardArrayWithContent):
             where = (where,)
         head, tail = where[:len(self._index.shape)], where[len(self._index.shape):]
 
+        isfancy = (tail == () and len(head) == 1 and self._isintarray(head[0]))
+
         head = self._index[head]
         if len(head.shape) != 0 and len(head) == 0:
             return awkward.util.numpy.empty(0, dtype=self._content.dtype)[tail]
+        elif isfancy:
+            # compose with inner indexes rather than stacking more levels of indirection
+            content = self._content
+            while isinstance(content, IndexedArray) and not isinstance(content, ByteIndexedArray):
+                head = content._index[head]
+                content = content._content
+            return self.copy(index=head, content=content)
         else:
             return self._content[(head,) + tail]
 
-    def _invert(self, what):
+    @staticmethod
+    def _isintarray(where):
+        return isinstance(where, (list, awkward.util.numpy.ndarray)) and len(where) != 0 and issubclass(awkward.util.numpy.asarray(where).dtype.type, awkward.util.numpy.integer)
+
+    def compact(self):
+        self._valid()
+        if isinstance(self._content, IndexedArray):
+            return self._content[self._index].compact()
+        else:
+            return self._content[self._index]
+
+    def _getinverse(self):
+        # computed (and checked for duplicates) once per index, then shared by every assignment and copy
         if self._inverse is None:
             self._inverse = invert(self._index)
-        return IndexedArray(self._inverse, what)
+        return self._inverse
+
+    def _invert(self, what):
+        inverse = self._getinverse()
+        out = IndexedArray.__new__(IndexedArray)
+        out._index = inverse
+        out._content = awkward.util.toarray(what, awkward.util.DEFAULTTYPE)
+        out._isvalid = False
+        if len(inverse) == self._index.size:
+            # the index is a full permutation, so it is the inverse of its inverse
+            out._inverse = self._index.reshape(-1)
+        else:
+            out._inverse = None
+        return out
 
     def __setitem__(self, where, what):
         if what.shape[:len(self._index.shape)] != self._index.shape:
@@ -186,11 +221,19 @@ class IndexedArray(awkward.array.base.AwkwardArrayWithContent):
         if method != "__call__":
             return NotImplemented
 
+        if "out" not in kwargs and not isinstance(self, ByteIndexedArray) and len(self._content) <= self._index.size and all(x is self or isinstance(x, (numbers.Number, awkward.util.string, bytes, awkward.util.numpy.generic)) for x in inputs):
+            # dictionary encoding: apply the ufunc to each distinct value once and map the results through the index
+            self._valid()
+            result = getattr(ufunc, method)(*[self._content if x is self else x for x in inputs], **kwargs)
+            if isinstance(result, tuple):
+                return tuple(x[self._index] for x in result)
+            else:
+                return result[self._index]
+
         inputs = list(inputs)
         for i in range(len(inputs)):
             if isinstance(inputs[i], IndexedArray):
-                inputs[i]._valid()
-                inputs[i] = inputs[i][:]
+                inputs[i] = inputs[i].compact()
 
         return getattr(ufunc, method)(*inputs, **kwargs)
 
@@ -221,6 +264,8 @@ class ByteIndexedArray(IndexedArray):
         out._index = self._index
         out._content = self._content
         out._dtype = self._dtype
+        out._inverse = self._inverse
+        out._isvalid = self._isvalid
         if index is not None:
             out.index = index
         if content is not None:
@@ -305,8 +350,13 @@ class ByteIndexedArray(IndexedArray):
     def __iter__(self):
         self._valid()
         itemsize = self._dtype.itemsize
-        for i in self._index:
-            yield self._content[i : i + itemsize].view(self._dtype)[0]
+        if self._dtype.subdtype is None:
+            for i in self._index:
+                yield self._content[i : i + itemsize].view(self._dtype)[0]
+        else:
+            dt, sh = self._dtype.subdtype
+            for i in self._index:
+                yield self._content[i : i + itemsize].view(dt).reshape(sh)
 
     def __getitem__(self, where):
         self._valid()
@@ -332,18 +382,28 @@ class ByteIndexedArray(IndexedArray):
                 dt, sh = self._dtype.subdtype
                 return self._content[starts : starts + self._dtype.itemsize].view(dt).reshape(sh)
 
+        elif len(head) == 1 and self._isintarray(head[0]):
+            return self.copy(index=starts)
+
         else:
-            if len(starts) == 0:
-                return awkward.util.numpy.empty(0, dtype=self._dtype)
+            return self._gather(starts)
 
+    def _gather(self, starts):
+        if len(starts) == 0:
+            return awkward.util.numpy.empty(0, dtype=self._dtype)
+
+        else:
+            index = awkward.util.numpy.repeat(starts, self._dtype.itemsize)
+            index += awkward.util.numpy.tile(awkward.util.numpy.arange(self._dtype.itemsize), len(starts))
+            if self._dtype.subdtype is None:
+                return self._content[index].view(self._dtype)
             else:
-                index = awkward.util.numpy.repeat(starts, self._dtype.itemsize)
-                index += awkward.util.numpy.tile(awkward.util.numpy.arange(self._dtype.itemsize), len(starts))
-                if self._dtype.subdtype is None:
-                    return self._content[index].view(self._dtype)
-                else:
-                    dt, sh = self._dtype.subdtype
-                    return self._content[index].view(dt).reshape((-1,) + sh)
+                dt, sh = self._dtype.subdtype
+                return self._content[index].view(dt).reshape((-1,) + sh)
+
+    def compact(self):
+        self._valid()
+        return self._gather(self._index)
 
     def __setitem__(self, where, what):
         if awkward.util.isstringslice(where):
@@ -452,6 +512,70 @@ class SparseArray(awkward.array.base.AwkwardArrayWithContent):
                          fill(self._content, self.__class__.__name__ + ".content", prefix, suffix, schemasuffix, storage, compression, **kwargs),
                          default]}
 
+    @staticmethod
+    def _coalesce(index, content, reduce):
+        # index is sorted; combine runs of equal index values with a ufunc reduction
+        if len(index) == 0:
+            return index, content
+        starts = awkward.util.numpy.empty(len(index), dtype=awkward.util.BOOLTYPE)
+        starts[0] = True
+        awkward.util.numpy.not_equal(index[1:], index[:-1], out=starts[1:])
+        starts = awkward.util.numpy.nonzero(starts)[0]
+        if len(starts) == len(index):
+            return index, content
+        if not isinstance(content, awkward.util.numpy.ndarray):
+            raise TypeError("duplicate indexes can only be combined for Numpy content")
+        return index[starts], reduce.reduceat(content, starts, axis=0)
+
+    @classmethod
+    def fromcoo(cls, length, index, content, reduce=awkward.util.numpy.add, default=None):
+        index = awkward.util.toarray(index, awkward.util.INDEXTYPE, awkward.util.numpy.ndarray)
+        content = awkward.util.toarray(content, awkward.util.DEFAULTTYPE)
+        if len(index.shape) != 1:
+            raise ValueError("index must be one-dimensional")
+        if len(index) != len(content):
+            raise ValueError("index has length {0} but content has length {1}".format(len(index), len(content)))
+        if len(index) > 0 and (index.min() < 0 or index.max() >= length):
+            raise ValueError("index must be non-negative and less than length ({0})".format(length))
+
+        if len(index) > 0 and not (index[1:] >= index[:-1]).all():
+            # stable, so that reduce sees duplicates in their original order
+            order = awkward.util.numpy.argsort(index, kind="mergesort")
+            index = index[order]
+            content = content[order]
+
+        index, content = cls._coalesce(index, content, reduce)
+        return cls(length, index, content, default=default)
+
+    def merge(self, index, content, reduce=awkward.util.numpy.add):
+        self._valid()
+        batch = self.fromcoo(self._length, index, content, reduce=reduce)
+
+        # merge two sorted runs: each batch element lands after the existing elements it does not precede
+        positions = self._explicit()
+        myindex = self._index[positions]
+        mycontent = self._content[positions]
+        where = awkward.util.numpy.searchsorted(myindex, batch._index, side="right") + awkward.util.numpy.arange(len(batch._index))
+        isbatch = awkward.util.numpy.zeros(len(myindex) + len(batch._index), dtype=awkward.util.BOOLTYPE)
+        isbatch[where] = True
+        notbatch = awkward.util.numpy.logical_not(isbatch)
+
+        index = awkward.util.numpy.empty(len(isbatch), dtype=awkward.util.INDEXTYPE)
+        index[where] = batch._index
+        index[notbatch] = myindex
+        if isinstance(mycontent, awkward.util.numpy.ndarray) and isinstance(batch._content, awkward.util.numpy.ndarray):
+            content = awkward.util.numpy.empty((len(isbatch),) + mycontent.shape[1:], dtype=awkward.util.numpy.result_type(mycontent, batch._content))
+            content[where] = batch._content
+            content[notbatch] = mycontent
+        else:
+            order = awkward.util.numpy.empty(len(isbatch), dtype=awkward.util.INDEXTYPE)
+            order[notbatch] = awkward.util.numpy.arange(len(myindex))
+            order[where] = awkward.util.numpy.arange(len(myindex), len(isbatch))
+            content = awkward.util.concatenate([mycontent, batch._content])[order]
+
+        index, content = self._coalesce(index, content, reduce)
+        return self.copy(index=index, content=content)
+
     @property
     def length(self):
         return self._length
@@ -495,10 +619,17 @@ class SparseArray(awkward.array.base.AwkwardArrayWithContent):
     @property
     def default(self):
         import awkward.array.jagged
+        import awkward.array.table
 
         if self._default is None:
             if isinstance(self._content, awkward.array.jagged.JaggedArray):
-                return awkward.array.jagged.JaggedArray([0], [0], self._content.content)
+                return self._content.content[:0]
+            elif isinstance(self._content, awkward.array.table.Table):
+                # a row whose fields are each column's own default
+                table = self._content.empty_like()
+                for n in self._content._content:
+                    table[n] = SparseArray(1, awkward.util.numpy.empty(0, dtype=awkward.util.INDEXTYPE), self._content[n])
+                return table.Row(table, 0)
             elif self._content.shape[1:] == ():
                 return self._content.dtype.type(0)
             else:
@@ -529,27 +660,47 @@ class SparseArray(awkward.array.base.AwkwardArrayWithContent):
 
             self._isvalid = True
 
+    def _explicit(self):
+        # positions in index (and content) of the first explicit value for each distinct index below length
+        index = self._index
+        keep = awkward.util.numpy.empty(len(index), dtype=awkward.util.BOOLTYPE)
+        if len(index) != 0:
+            keep[0] = True
+            awkward.util.numpy.not_equal(index[1:], index[:-1], out=keep[1:])
+            keep &= (index < self._length)
+        return awkward.util.numpy.nonzero(keep)[0]
+
     def __iter__(self):
         self._valid()
 
         length = self._length
-        index = self._index
-        lenindex = len(self._index)
         content = self._content
         default = self.default
 
+        positions = self._explicit()
         i = 0
-        j = awkward.util.numpy.searchsorted(index, 0, side="left")
-        while i != length:
-            if j == lenindex:
-                yield default
-            elif index[j] == i:
-                yield content[j]
-                while j != lenindex and index[j] == i:
-                    j += 1
-            else:
-                yield default
-            i += 1
+        for j, where in zip(positions.tolist(), self._index[positions].tolist()):
+            for x in itertools.repeat(default, where - i):
+                yield x
+            yield content[j]
+            i = where + 1
+        for x in itertools.repeat(default, length - i):
+            yield x
+
+    def tolist(self):
+        self._valid()
+
+        positions = self._explicit()
+        default = self.default
+        if isinstance(self._content, awkward.util.numpy.ndarray) and len(self._content.shape) == 1:
+            out = [self._try_tolist(default)] * self._length
+        else:
+            # defaults that convert to mutable lists/dicts must not be shared
+            out = [self._try_tolist(default) for i in range(self._length)]
+
+        for where, x in zip(self._index[positions].tolist(), self._content[positions].tolist()):
+            out[where] = x
+        return out
 
     def __getitem__(self, where):
         import awkward.array.union
@@ -675,13 +826,29 @@ class SparseArray(awkward.array.base.AwkwardArrayWithContent):
 
     @property
     def dense(self):
+        import awkward.array.jagged
+        import awkward.array.table
         self._valid()
 
+        positions = self._explicit()
+        where = self._index[positions]
+
         if isinstance(self._content, awkward.util.numpy.ndarray):
-            out = awkward.util.numpy.full(self.shape, self.default, dtype=self.dtype)
-            if len(self._index) != 0:
-                mask = self.boolmask(maskedwhen=True)
-                out[mask] = self._content[self._inverse[mask]]
+            out = awkward.util.numpy.full((self._length,) + self._content.shape[1:], self.default, dtype=self._content.dtype)
+            out[where] = self._content[positions]
+            return out
+
+        elif isinstance(self._content, awkward.array.jagged.JaggedArray) and not isinstance(self._content, awkward.array.jagged.ByteJaggedArray) and self._default is None:
+            # defaults are empty subarrays: only the counts need to be filled in
+            selected = self._content[positions]
+            counts = awkward.util.numpy.zeros(self._length, dtype=awkward.util.INDEXTYPE)
+            counts[where] = selected.counts
+            return self._content.fromcounts(counts, selected.flatten())
+
+        elif isinstance(self._content, awkward.array.table.Table) and self._default is None:
+            out = self._content.empty_like()
+            for n in self._content._content:
+                out[n] = SparseArray(self._length, self._index, self._content[n]).dense
             return out
 
         else:
@@ -724,21 +891,169 @@ class SparseArray(awkward.array.base.AwkwardArrayWithContent):
         else:
             raise TypeError("invalid index for assigning column to Table: {0}".format(where))
 
+    # ufuncs that return the (zero) default wherever any argument is the (zero) default
+    _annihilating = (awkward.util.numpy.multiply, awkward.util.numpy.logical_and, awkward.util.numpy.bitwise_and)
+
+    @staticmethod
+    def _finite(x):
+        # inf*0 and nan*0 are nan, so the annihilating shortcut only holds for finite values
+        x = awkward.util.numpy.asarray(x)
+        if issubclass(x.dtype.type, (awkward.util.numpy.integer, awkward.util.numpy.bool_)):
+            return True
+        try:
+            return bool(awkward.util.numpy.isfinite(x).all())
+        except TypeError:
+            return False
+
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         if method != "__call__":
             return NotImplemented
 
-        inputs = list(inputs)
-        for i in range(len(inputs)):
-            if isinstance(inputs[i], SparseArray):
-                inputs[i]._valid()
-                inputs[i] = inputs[i].dense   # FIXME: can do better (optimization)
+        length = None
+        sparse = True
+        for x in inputs:
+            if isinstance(x, SparseArray):
+                x._valid()
+                if length is None:
+                    length = x._length
+                elif length != x._length:
+                    raise ValueError("SparseArrays have different lengths: {0} and {1}".format(length, x._length))
+                if not isinstance(x._content, awkward.util.numpy.ndarray):
+                    sparse = False
+            elif isinstance(x, (awkward.util.numpy.ndarray, awkward.array.base.AwkwardArray)) and len(x.shape) != 0:
+                sparse = False
+            elif not isinstance(x, (numbers.Number, awkward.util.numpy.generic, awkward.util.numpy.ndarray)):
+                sparse = False
+
+        if not sparse or "out" in kwargs:
+            inputs = list(inputs)
+            for i in range(len(inputs)):
+                if isinstance(inputs[i], SparseArray):
+                    inputs[i] = inputs[i].dense
+            return getattr(ufunc, method)(*inputs, **kwargs)
+
+        # merge the sorted indexes of all SparseArray arguments, never touching the implicit defaults
+        positions = [x._explicit() if isinstance(x, SparseArray) else None for x in inputs]
+        indexes = [x._index[p] for x, p in zip(inputs, positions) if isinstance(x, SparseArray)]
+        if ufunc in self._annihilating and all(awkward.util.numpy.all(x.default == 0) for x in inputs if isinstance(x, SparseArray)) and all(self._finite(x._content[p] if isinstance(x, SparseArray) else x) for x, p in zip(inputs, positions)):
+            index = indexes[0]
+            for x in indexes[1:]:
+                index = awkward.util.numpy.intersect1d(index, x, assume_unique=True)
+        else:
+            index = awkward.util.numpy.unique(awkward.util.numpy.concatenate(indexes))
+
+        contents = []
+        defaults = []
+        for x, p in zip(inputs, positions):
+            if isinstance(x, SparseArray):
+                myindex = x._index[p]
+                default = x.default
+                content = awkward.util.numpy.empty((len(index),) + x._content.shape[1:], dtype=x._content.dtype)
+                content[...] = default
+                if len(myindex) != 0:
+                    match = awkward.util.numpy.searchsorted(myindex, index, side="left")
+                    match[match >= len(myindex)] = len(myindex) - 1
+                    found = (myindex[match] == index)
+                    content[found] = x._content[p[match[found]]]
+                contents.append(content)
+                defaults.append(default)
+            else:
+                contents.append(x)
+                defaults.append(x)
 
-        return getattr(ufunc, method)(*inputs, **kwargs)
+        result = getattr(ufunc, method)(*contents, **kwargs)
+        default = getattr(ufunc, method)(*defaults, **kwargs)
+
+        if isinstance(result, tuple):
+            return tuple(SparseArray(length, index, x, default=d) for x, d in zip(result, default))
+        else:
+            return SparseArray(length, index, result, default=default)
+
+    def _reduce(self, name, combine):
+        # reduce the explicit content once and fold in the (length - nnz) implicit defaults
+        self._valid()
+        if not isinstance(self._content, awkward.util.numpy.ndarray):
+            return getattr(self.dense, name)()
+
+        content = self._content[self._explicit()]
+        numdefaults = self._length - len(content)
+        if len(content) == 0:
+            if numdefaults == 0:
+                raise ValueError("zero-size SparseArray has no {0}".format(name))
+            return combine(None, self.default, numdefaults)
+        else:
+            out = getattr(content, name)(axis=0)
+            if numdefaults == 0:
+                return out
+            else:
+                return combine(out, self.default, numdefaults)
+
+    def sum(self):
+        self._valid()
+        if self._length == 0:
+            return self._content[:0].sum(axis=0)
+        return self._reduce("sum", lambda out, default, n: (0 if out is None else out) + default * n)
+
+    def mean(self):
+        self._valid()
+        if self._length == 0:
+            return self._content[:0].mean(axis=0)
+        return awkward.util.numpy.true_divide(self.sum(), self._length)
+
+    def count_nonzero(self):
+        self._valid()
+        if not isinstance(self._content, awkward.util.numpy.ndarray):
+            return awkward.util.numpy.count_nonzero(self.dense)
+        content = self._content[self._explicit()]
+        return awkward.util.numpy.count_nonzero(content) + (self._length - len(content)) * awkward.util.numpy.count_nonzero(self.default)
+
+    def min(self):
+        return self._reduce("min", lambda out, default, n: default if out is None else awkward.util.numpy.minimum(out, default))
+
+    def max(self):
+        return self._reduce("max", lambda out, default, n: default if out is None else awkward.util.numpy.maximum(out, default))
+
+    def any(self):
+        self._valid()
+        if self._length == 0:
+            return False
+        return self._reduce("any", lambda out, default, n: awkward.util.numpy.logical_or(False if out is None else out, default))
+
+    def all(self):
+        self._valid()
+        if self._length == 0:
+            return True
+        return self._reduce("all", lambda out, default, n: awkward.util.numpy.logical_and(True if out is None else out, default))
 
     @classmethod
     def concat(cls, first, *rest):
-        raise NotImplementedError
+        arrays = (first,) + rest
+        for x in arrays:
+            x._valid()
+
+        if not all(isinstance(x, SparseArray) for x in arrays):
+            raise TypeError("cannot concat SparseArrays with non-SparseArrays")
+        for x in rest:
+            if not awkward.util.numpy.array_equal(x.default, first.default):
+                raise ValueError("cannot concat SparseArrays with different defaults")
+
+        # only the explicit elements are shifted and joined; defaults are never materialized
+        positions = [x._explicit() for x in arrays]
+        offsets = awkward.util.numpy.cumsum([0] + [x._length for x in arrays])
+        index = awkward.util.numpy.concatenate([x._index[p] + offset for x, p, offset in zip(arrays, positions, offsets)]).astype(awkward.util.INDEXTYPE)
+        content = awkward.util.concatenate([x._content[p] for x, p in zip(arrays, positions)])
+
+        return cls(offsets[-1], index, content, default=first._default)
+
+    @classmethod
+    def fromchunked(cls, chunked):
+        chunked.knowcounts()
+        chunks = [chunk[:count] for chunk, count in zip(chunked.chunks, chunked.counts) if count != 0]
+        if not all(isinstance(x, SparseArray) for x in chunks):
+            raise TypeError("fromchunked requires a ChunkedArray of SparseArrays")
+        if len(chunks) == 0:
+            raise ValueError("fromchunked requires at least one non-empty chunk")
+        return cls.concat(*chunks)
 
     def pandas(self):
         raise NotImplementedError
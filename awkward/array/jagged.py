@@ -28,6 +28,7 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import itertools
 import math
 import numbers
 
@@ -101,6 +102,33 @@ def uniques2offsetsparents(uniques):
 
     return offsets, parents
 
+def iter2countscontent(iterable, dtype=None):
+    # two passes over the subsequences (not their elements): counts first, then one content buffer
+    items = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+    counts = awkward.util.numpy.fromiter((len(x) for x in items), dtype=awkward.util.INDEXTYPE, count=len(items))
+
+    if all(isinstance(x, (bytes, bytearray, memoryview)) for x in items) and len(items) != 0:
+        dtype = awkward.util.numpy.dtype(awkward.util.CHARTYPE if dtype is None else dtype)
+        counts //= dtype.itemsize
+        content = awkward.util.numpy.frombuffer(b"".join(items), dtype=dtype)
+
+    elif all(isinstance(x, awkward.util.numpy.ndarray) for x in items) and len(items) != 0:
+        content = awkward.util.numpy.concatenate(items)
+        if dtype is not None:
+            content = content.astype(dtype, copy=False)
+
+    elif dtype is not None:
+        dtype = awkward.util.numpy.dtype(dtype)
+        if dtype.kind in "biuf" and dtype.subdtype is None:
+            content = awkward.util.numpy.fromiter(itertools.chain.from_iterable(items), dtype=dtype, count=counts.sum())
+        else:
+            content = awkward.util.numpy.array(list(itertools.chain.from_iterable(items)), dtype=dtype)
+
+    else:
+        content = awkward.util.numpy.array(list(itertools.chain.from_iterable(items)))
+
+    return counts, content
+
 class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
     """
     JaggedArray
@@ -112,13 +140,9 @@ class JaggedArray(awkward.array.base.AwkwardArrayWithContent):
         self.content = content
 
     @classmethod
-    def fromiter(cls, iterable):
-        offsets = [0]
-        content = []
-        for x in iterable:
-            offsets.append(offsets[-1] + len(x))
-            content.extend(x)
-        return cls.fromoffsets(offsets, content)
+    def fromiter(cls, iterable, dtype=None):
+        counts, content = iter2countscontent(iterable, dtype)
+        return cls.fromoffsets(counts2offsets(counts), content)
 
     @classmethod
     def fromoffsets(cls, offsets, content):
@@ -1102,14 +1126,9 @@ class ByteJaggedArray(JaggedArray):
         self.subdtype = subdtype
 
     @classmethod
-    def fromiter(cls, iterable):
-        offsets = [0]
-        content = []
-        for x in iterable:
-            offsets.append(offsets[-1] + len(x))
-            content.extend(x)
-        offsets = awkward.util.numpy.array(offsets, dtype=awkward.util.INDEXTYPE)
-        content = awkward.util.numpy.array(content)
+    def fromiter(cls, iterable, dtype=None):
+        counts, content = iter2countscontent(iterable, dtype)
+        offsets = counts2offsets(counts)
         offsets *= content.dtype.itemsize
         return cls(offsets[:-1], offsets[1:], content, subdtype=content.dtype)
 
@@ -1276,7 +1295,11 @@ class ByteJaggedArray(JaggedArray):
         return node[tail]
 
     def _tojagged(self, starts=None, stops=None, copy=True):
-        if starts is None and stops is None:
+        if starts is None and stops is None and self._subdtype.itemsize == 1 and self._canuseoffset() and (len(self._starts) == 0 or self._starts[0] == 0):
+            # already compact: reuse the offsets in their own dtype (e.g. 32-bit from Arrow) rather than rebuilding them
+            bytestarts, bytestops = starts, stops = self._starts, self._stops
+
+        elif starts is None and stops is None:
             byteoffsets = counts2offsets(self.counts.reshape(-1))
             bytestarts, bytestops = byteoffsets[:-1].reshape(self._starts.shape), byteoffsets[1:].reshape(self._starts.shape)
             offsets = self._divitemsize(byteoffsets)
@@ -1315,7 +1338,7 @@ class ByteJaggedArray(JaggedArray):
         if (bytestops - bytestarts != (stops - starts) * self._subdtype.itemsize).any():
             raise ValueError("not all counts are a multiple of {0}".format(self._subdtype.itemsize))
 
-        if awkward.util.numpy.array_equal(bytestarts, self._starts) and awkward.util.numpy.array_equal(bytestops, self._stops):
+        if (bytestarts is self._starts or awkward.util.numpy.array_equal(bytestarts, self._starts)) and (bytestops is self._stops or awkward.util.numpy.array_equal(bytestops, self._stops)):
             return JaggedArray(starts, stops, content=(awkward.util.deepcopy(self._content) if copy else self._content))
 
         else:
@@ -35,6 +35,40 @@ import awkward.array.base
 import awkward.type
 import awkward.util
 
+def _fillna(content, tokeep, index, value):
+    # content[index] where tokeep and value elsewhere, keeping the content's structure where possible
+    import awkward.array.jagged
+    import awkward.array.table
+    import awkward.array.union
+
+    if isinstance(content, awkward.util.numpy.ndarray):
+        out = awkward.util.numpy.empty((len(tokeep),) + content.shape[1:], dtype=awkward.util.numpy.result_type(content, value))
+        out[...] = value
+        out[tokeep] = content[index[tokeep]]
+        return out
+
+    elif isinstance(content, awkward.array.table.Table):
+        out = content.empty_like()
+        for n in content._content:
+            out[n] = _fillna(content[n], tokeep, index, value[n] if isinstance(value, dict) else value)
+        return out
+
+    elif isinstance(content, awkward.array.jagged.JaggedArray) and not isinstance(content, awkward.array.jagged.ByteJaggedArray) and isinstance(content.content, awkward.util.numpy.ndarray) and len(content.starts.shape) == 1:
+        # the fill value is appended to the inner content once and every missing entry points to it
+        fill = awkward.util.numpy.asarray(value)
+        dtype = content.content.dtype if fill.size == 0 else awkward.util.numpy.result_type(content.content, fill)
+        fill = fill.astype(dtype).reshape((-1,) + content.content.shape[1:])
+        inner = awkward.util.numpy.concatenate([content.content, fill])
+        starts = awkward.util.numpy.where(tokeep, content.starts[index], len(content.content))
+        stops = awkward.util.numpy.where(tokeep, content.stops[index], len(inner))
+        return content.copy(starts=starts, stops=stops, content=inner)
+
+    else:
+        # anything else becomes a union of the content and the fill value
+        import awkward.generate
+        tags = awkward.util.numpy.where(tokeep, 0, 1).astype(awkward.util.TAGTYPE)
+        return awkward.array.union.UnionArray(tags, awkward.util.numpy.where(tokeep, index, 0), [content, awkward.generate.fromiter([value])])
+
 class MaskedArray(awkward.array.base.AwkwardArrayWithContent):
     """
     MaskedArray
@@ -188,6 +222,13 @@ class MaskedArray(awkward.array.base.AwkwardArrayWithContent):
                 yield content[i]
             i += 1
 
+    def tolist(self):
+        # convert the content in bulk and only then put the masked values back
+        self._valid()
+        valid = self.boolmask(maskedwhen=False)
+        content = self._content[:len(valid)].tolist()
+        return [x if isvalid else None for x, isvalid in zip(content, valid.tolist())]
+
     def __getitem__(self, where):
         self._valid()
 
@@ -263,6 +304,41 @@ class MaskedArray(awkward.array.base.AwkwardArrayWithContent):
         else:
             return awkward.array.objects.Methods.maybemixin(type(result), IndexedMaskedArray)(index, result, maskedwhen=-1)
 
+    @staticmethod
+    def _compress(content, tokeep):
+        import awkward.array.jagged
+        if isinstance(content, awkward.array.jagged.JaggedArray) and not isinstance(content, awkward.array.jagged.ByteJaggedArray) and len(content.starts.shape) == 1:
+            # select the subarrays and pack their contents with new offsets in a single gather
+            content._valid()
+            if issubclass(tokeep.dtype.type, (awkward.util.numpy.bool_, awkward.util.numpy.bool)):
+                tokeep = awkward.util.numpy.nonzero(tokeep)[0]
+            starts = content.starts[tokeep]
+            counts = content.stops[tokeep] - starts
+            offsets = awkward.array.jagged.counts2offsets(counts)
+            index = awkward.util.numpy.arange(offsets[-1], dtype=awkward.util.INDEXTYPE)
+            index += awkward.util.numpy.repeat(starts - offsets[:-1], counts)
+            return content.copy(starts=offsets[:-1], stops=offsets[1:], content=content.content[index])
+        else:
+            return content[tokeep]
+
+    def dropna(self):
+        self._valid()
+        tokeep = self.boolmask(maskedwhen=False)
+        return self._compress(self._content[:len(tokeep)], tokeep)
+
+    def fillna(self, value):
+        self._valid()
+        tokeep = self.boolmask(maskedwhen=False)
+        if isinstance(self._content, awkward.util.numpy.ndarray):
+            # written directly into the output, without gathering the content
+            content = self._content[:len(tokeep)]
+            out = awkward.util.numpy.empty(content.shape, dtype=awkward.util.numpy.result_type(content, value))
+            out[...] = value
+            awkward.util.numpy.copyto(out, content, where=tokeep.reshape((-1,) + (1,)*(len(content.shape) - 1)))
+            return out
+        else:
+            return _fillna(self._content, tokeep, awkward.util.numpy.arange(len(tokeep), dtype=awkward.util.INDEXTYPE), value)
+
     def indexed(self):
         maskindex = awkward.util.numpy.arange(len(self), dtype=awkward.util.INDEXTYPE)
         maskindex[self.boolmask(maskedwhen=True)] = -1
@@ -340,9 +416,14 @@ class BitMaskedArray(MaskedArray):
 
     @staticmethod
     def bit2bool(bitmask, lsborder=False):
-        out = awkward.util.numpy.unpackbits(bitmask)
         if lsborder:
-            out = out.reshape(-1, 8)[:,::-1].reshape(-1)
+            try:
+                # Numpy 1.17+ unpacks little-endian bit order in a single pass
+                out = awkward.util.numpy.unpackbits(bitmask, bitorder="little")
+            except TypeError:
+                out = awkward.util.numpy.unpackbits(bitmask).reshape(-1, 8)[:,::-1].reshape(-1)
+        else:
+            out = awkward.util.numpy.unpackbits(bitmask)
         return out.view(awkward.util.MASKTYPE)
         
     @staticmethod
@@ -354,6 +435,12 @@ class BitMaskedArray(MaskedArray):
             boolmask = (boolmask != 0)
 
         if lsborder:
+            try:
+                # Numpy 1.17+ packs little-endian bit order (and pads) in a single pass
+                return awkward.util.numpy.packbits(boolmask, bitorder="little")
+            except TypeError:
+                pass
+
             # maybe pad the length for reshape
             length = BitMaskedArray._ceildiv8(len(boolmask)) * 8
             if length != len(boolmask):
@@ -396,41 +483,23 @@ class BitMaskedArray(MaskedArray):
     def __iter__(self):
         self._valid()
 
-        one = awkward.util.numpy.uint8(1)
-        zero = awkward.util.numpy.uint8(0)
-        mask = self._mask
         content = self._content
         lencontent = len(content)
-        maskedwhen = self._maskedwhen
         masked = self.masked
 
-        if self._lsborder:
-            byte = i = 0
-            bit = start = awkward.util.numpy.uint8(1)
-            while i < lencontent:
-                if ((mask[byte] & bit) != 0) == self._maskedwhen:
-                    yield masked
+        # unpack the mask one block of bytes at a time, rather than one bit at a time
+        blocksize = 8192
+        for bytestart in range(0, self._ceildiv8(lencontent), blocksize):
+            start = bytestart * 8
+            stop = min(start + blocksize * 8, lencontent)
+            valid = self.bit2bool(self._mask[bytestart : bytestart + blocksize], lsborder=self._lsborder)[:stop - start]
+            if self._maskedwhen:
+                valid = awkward.util.numpy.logical_not(valid)
+            for x, isvalid in zip(content[start:stop], valid.tolist()):
+                if isvalid:
+                    yield x
                 else:
-                    yield content[i]
-                bit <<= one
-                if bit == zero:
-                    bit = start
-                    byte += 1
-                i += 1
-
-        else:
-            byte = i = 0
-            bit = start = awkward.util.numpy.uint8(128)
-            while i < lencontent:
-                if ((mask[byte] & bit) != 0) == self._maskedwhen:
                     yield masked
-                else:
-                    yield content[i]
-                bit >>= one
-                if bit == zero:
-                    bit = start
-                    byte += 1
-                i += 1
 
     def _maskat(self, where):
         bytepos = awkward.util.numpy.right_shift(where, 3)    # where // 8
@@ -448,14 +517,47 @@ class BitMaskedArray(MaskedArray):
 
         return bytepos, bitmask
 
+    def _packedslice(self, start, stop):
+        # bits [start, stop) of the mask, shifted down to start at bit zero without unpacking them
+        numbytes = self._ceildiv8(max(stop - start, 0))
+        bytestart, shift = start >> 3, start & 7
+
+        low = self._mask[bytestart : bytestart + numbytes]
+        if shift == 0:
+            return low
+
+        high = awkward.util.numpy.zeros(len(low), dtype=awkward.util.BITMASKTYPE)
+        tmp = self._mask[bytestart + 1 : bytestart + numbytes + 1]
+        high[:len(tmp)] = tmp
+
+        shift = awkward.util.BITMASKTYPE.type(shift)
+        unshift = awkward.util.BITMASKTYPE.type(8 - shift)
+        if self._lsborder:
+            return awkward.util.numpy.bitwise_or(awkward.util.numpy.right_shift(low, shift), awkward.util.numpy.left_shift(high, unshift))
+        else:
+            return awkward.util.numpy.bitwise_or(awkward.util.numpy.left_shift(low, shift), awkward.util.numpy.right_shift(high, unshift))
+
     def _maskwhere(self, where):
         if isinstance(where, awkward.util.integer):
             bytepos, bitmask = self._maskat(where)
             return awkward.util.numpy.bitwise_and(self._mask[bytepos], bitmask) != 0
 
         elif isinstance(where, slice):
-            # assumes a small slice; for a big slice, it could be faster to unpack the whole mask
-            return self._maskwhere(awkward.util.numpy.arange(*where.indices(len(self._content))))
+            start, stop, step = where.indices(len(self._content))
+            if step == 1:
+                return self.bit2bool(self._packedslice(start, stop), lsborder=self._lsborder)[:max(stop - start, 0)]
+            else:
+                # only unpack the bytes that the slice touches
+                if step > 0:
+                    length = max(0, (stop - start + step - 1) // step)
+                else:
+                    length = max(0, (start - stop - step - 1) // -step)
+                if length == 0:
+                    return awkward.util.numpy.empty(0, dtype=awkward.util.MASKTYPE)
+                last = start + (length - 1)*step
+                bytestart = min(start, last) >> 3
+                unpacked = self.bit2bool(self._mask[bytestart : (max(start, last) >> 3) + 1], lsborder=self._lsborder)
+                return unpacked[start - bytestart*8 :: step][:length]
 
         else:
             where = awkward.util.numpy.array(where, copy=False)
@@ -498,6 +600,11 @@ class BitMaskedArray(MaskedArray):
             else:
                 return self._content[(head,) + tail]
 
+        elif isinstance(head, slice) and head.indices(len(self._content))[2] == 1 and tail == ():
+            # contiguous slice: shift the packed bits rather than unpacking and repacking them
+            start, stop, step = head.indices(len(self._content))
+            return self.copy(mask=self._packedslice(start, stop), content=self._content[head], lsborder=self._lsborder)
+
         else:
             mask = self._maskwhere(head)
             if tail != () and ((self._maskedwhen and mask.any()) or (not self._maskedwhen and not mask.all())):
@@ -505,6 +612,63 @@ class BitMaskedArray(MaskedArray):
             else:
                 return self.copy(mask=self.bool2bit(mask, lsborder=self._lsborder), content=self._content[(head,) + tail], lsborder=self._lsborder)
 
+    # maps each byte to the same byte with its bits in reverse order (converts lsborder <-> msborder)
+    _reversedbits = awkward.util.numpy.array([int("{0:08b}".format(i)[::-1], 2) for i in range(256)], dtype=awkward.util.BITMASKTYPE)
+
+    def _validbits(self, lsborder):
+        # packed bits that are set where the array is *not* masked, in the requested bit order
+        if self._maskedwhen:
+            out = awkward.util.numpy.bitwise_not(self._mask)
+        else:
+            out = self._mask
+        if self._lsborder != lsborder:
+            out = self._reversedbits[out]
+        return out
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        import awkward.array.objects
+
+        if method != "__call__" or any(isinstance(x, MaskedArray) and not isinstance(x, BitMaskedArray) for x in inputs):
+            return super(BitMaskedArray, self).__array_ufunc__(ufunc, method, *inputs, **kwargs)
+
+        # combine validity with bitwise operations on the packed masks; never unpack them
+        lsborder = None
+        tokeep = None
+        for x in inputs:
+            if isinstance(x, BitMaskedArray):
+                x._valid()
+                if lsborder is None:
+                    lsborder = x._lsborder
+                    tokeep = x._validbits(lsborder)
+                else:
+                    tokeep = awkward.util.numpy.bitwise_and(tokeep, x._validbits(lsborder))
+
+        assert tokeep is not None
+
+        inputs = list(inputs)
+        for i in range(len(inputs)):
+            if isinstance(inputs[i], BitMaskedArray):
+                inputs[i] = inputs[i]._content
+            elif isinstance(inputs[i], (awkward.util.numpy.ndarray, awkward.array.base.AwkwardArray)):
+                pass
+            else:
+                try:
+                    for first in inputs[i]:
+                        break
+                except TypeError:
+                    pass
+                else:
+                    inputs[i] = awkward.util.numpy.array(inputs[i], copy=False)
+
+        # compute all elements, including the masked ones (as numpy.ma does, ignoring domain errors)
+        with awkward.util.numpy.errstate(divide="ignore", invalid="ignore"):
+            result = getattr(ufunc, method)(*inputs, **kwargs)
+
+        if isinstance(result, tuple):
+            return tuple(awkward.array.objects.Methods.maybemixin(type(x), BitMaskedArray)(tokeep, x, maskedwhen=False, lsborder=lsborder) if isinstance(x, (awkward.util.numpy.ndarray, awkward.array.base.AwkwardArray)) else x for x in result)
+        else:
+            return awkward.array.objects.Methods.maybemixin(type(result), BitMaskedArray)(tokeep, result, maskedwhen=False, lsborder=lsborder)
+
     @classmethod
     def concat(cls, first, *rest):
         raise NotImplementedError
@@ -610,6 +774,12 @@ class IndexedMaskedArray(MaskedArray):
                 yield content[maskindex]
             i += 1
 
+    def tolist(self):
+        self._valid()
+        valid = self.boolmask(maskedwhen=False)
+        content = iter(self._content[self._mask[valid]].tolist())
+        return [next(content) if isvalid else None for isvalid in valid.tolist()]
+
     def __getitem__(self, where):
         self._valid()
 
@@ -638,9 +808,26 @@ class IndexedMaskedArray(MaskedArray):
             else:
                 return self.copy(mask=maskindex)
 
+    def dropna(self):
+        self._valid()
+        return self._compress(self._content, self._mask[self._mask != self._maskedwhen])
+
+    def fillna(self, value):
+        self._valid()
+        tokeep = self.boolmask(maskedwhen=False)
+        return _fillna(self._content, tokeep, awkward.util.numpy.where(tokeep, self._mask, 0), value)
+
     def indexed(self):
         return self
 
+    def compact(self):
+        # gather the referenced content so that the mask-index becomes a running count
+        self._valid()
+        valid = self.boolmask(maskedwhen=False)
+        mask = awkward.util.numpy.full(len(self._mask), self._maskedwhen, dtype=self._mask.dtype)
+        mask[valid] = awkward.util.numpy.arange(awkward.util.numpy.count_nonzero(valid))
+        return self.copy(mask=mask, content=self._content[self._mask[valid]])
+
     @classmethod
     def concat(cls, first, *rest):
         raise NotImplementedError
@@ -28,9 +28,11 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import collections
 import types
 
 import awkward.array.base
+import awkward.array.virtual
 import awkward.type
 import awkward.util
 
@@ -129,6 +131,7 @@ class Table(awkward.array.base.AwkwardArray):
         self._base = None
         self.rowname = "Row"
         self._content = awkward.util.OrderedDict()
+        self._gathered = {}
 
         seen = set()
         if isinstance(columns1, dict):
@@ -157,7 +160,84 @@ class Table(awkward.array.base.AwkwardArray):
             self[n] = x
 
     def tolist(self):
-        return list(x.tolist() for x in self)
+        # column by column, rather than one Row and one getitem per column per row
+        names = list(self._content)
+        if len(names) == 0:
+            return [{} for i in range(self._length())]
+        columns = [self._try_tolist(self[n]) for n in names]
+        return [dict(zip(names, x)) for x in zip(*columns)]
+
+    def itertuples(self, blocksize=65536):
+        names = list(self._content)
+        cls = collections.namedtuple(self._rowname, names, rename=True)
+        columns = [self[n] for n in names]
+        length = self._length()
+        for start in range(0, length, blocksize):
+            stop = min(start + blocksize, length)
+            for x in zip(*[self._try_tolist(x[start:stop]) for x in columns]):
+                yield cls._make(x)
+
+    @staticmethod
+    def _recview(columns):
+        # a structured view of columns that are all fields of the same record buffer, or None if they aren't
+        base = None
+        for x in columns.values():
+            if not isinstance(x, awkward.util.numpy.ndarray) or len(x.shape) == 0:
+                return None
+            root = x
+            while isinstance(root.base, awkward.util.numpy.ndarray):
+                root = root.base
+            if base is None:
+                base = root
+            elif root is not base:
+                return None
+
+        if base is None or not base.flags.c_contiguous:
+            return None
+
+        first = next(iter(columns.values()))
+        stride = first.strides[0]
+        if stride <= 0 or any(x.shape[:1] != first.shape[:1] or x.strides[0] != stride for x in columns.values()):
+            return None
+
+        baseaddress = base.__array_interface__["data"][0]
+        addresses = dict((n, x.__array_interface__["data"][0]) for n, x in columns.items())
+        start = min(addresses.values())
+
+        names, formats, offsets, itemsize = [], [], [], 0
+        for n, x in columns.items():
+            offset = addresses[n] - start
+            size = x.dtype.itemsize * int(awkward.util.numpy.prod(x.shape[1:]))
+            if x.strides[1:] != awkward.util.numpy.empty((0,) + x.shape[1:], dtype=x.dtype).strides[1:] or offset + size > stride:
+                return None
+            names.append(n)
+            formats.append((x.dtype, x.shape[1:]) if len(x.shape) > 1 else x.dtype)
+            offsets.append(offset)
+            itemsize = max(itemsize, offset + size)
+
+        try:
+            dtype = awkward.util.numpy.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": itemsize})
+            return awkward.util.numpy.ndarray(first.shape[:1], dtype=dtype, buffer=base, offset=start - baseaddress, strides=(stride,))
+        except (TypeError, ValueError):
+            return None    # overlapping fields or a buffer that can't be exported
+
+    def torec(self, aligned=None):
+        # aligned=None: view the shared record buffer if there is one, else pack; False/True: require packed/C-aligned layout
+        columns = awkward.util.OrderedDict((n, self[n]) for n in self._content)
+        for n, x in columns.items():
+            if not isinstance(x, awkward.util.numpy.ndarray):
+                raise TypeError("column {0} is not a Numpy array and cannot be put in a structured array".format(repr(n)))
+
+        dtype = awkward.util.numpy.dtype([(n, x.dtype, x.shape[1:]) for n, x in columns.items()], align=bool(aligned))
+
+        out = self._recview(columns)
+        if out is not None and (aligned is None or (out.dtype == dtype and out.strides[0] == dtype.itemsize)):
+            return out
+
+        out = awkward.util.numpy.empty(self._length(), dtype=dtype)
+        for n, x in columns.items():
+            out[n] = x
+        return out
 
     @classmethod
     def named(cls, rowname, columns1={}, *columns2, **columns3):
@@ -176,12 +256,15 @@ class Table(awkward.array.base.AwkwardArray):
         self._rowname = value
 
     @classmethod
-    def fromrec(cls, recarray):
+    def fromrec(cls, recarray, copy=False):
         if not isinstance(recarray, awkward.util.numpy.ndarray) or recarray.dtype.names is None:
             raise TypeError("recarray must be a Numpy structured array")
         out = cls()
         for n in recarray.dtype.names:
-            out[n] = recarray[n]
+            if copy:
+                out[n] = awkward.util.numpy.array(recarray[n], copy=True, order="C")
+            else:
+                out[n] = recarray[n].view(awkward.util.numpy.ndarray)
         return out
 
     @classmethod
@@ -224,6 +307,7 @@ class Table(awkward.array.base.AwkwardArray):
             out._content = awkward.util.OrderedDict(content)
         else:
             out._content = awkward.util.OrderedDict(self._content.items())
+        out._gathered = {}
         return out
 
     def deepcopy(self, content=None):
@@ -243,6 +327,7 @@ class Table(awkward.array.base.AwkwardArray):
         out._base = None
         out._rowname = self._rowname
         out._content = awkward.util.OrderedDict()
+        out._gathered = {}
         return out
 
     def zeros_like(self, **overrides):
@@ -335,6 +420,32 @@ class Table(awkward.array.base.AwkwardArray):
         else:
             return self._view
 
+    @staticmethod
+    def _readonly(array):
+        # nothing can write to the buffer of a read-only array whose bases are all read-only
+        while isinstance(array, awkward.util.numpy.ndarray):
+            if array.flags.writeable:
+                return False
+            array = array.base
+        return True
+
+    def _gather(self, name):
+        # columns of a view are only gathered when they're accessed, and a gathered (copied) column is cached
+        # if the column can't be changed in place, since the copy would not see the change
+        content = self._content[name]
+        index = self._index()
+        if index is None:
+            return content
+        elif isinstance(index, slice):
+            return content[index]
+        elif not isinstance(content, awkward.util.numpy.ndarray) or not self._readonly(content):
+            return content[index]
+
+        cached = self._gathered.get(name, None)
+        if cached is None or cached[0] is not content:
+            cached = self._gathered[name] = (content, content[index])
+        return cached[1]
+
     def _newslice(self, head):
         if isinstance(head, awkward.util.integer):
             original_head = head
@@ -394,7 +505,7 @@ class Table(awkward.array.base.AwkwardArray):
                 length = self._length()
                 negative = (head < 0)
                 if negative.any():
-                    head[negative] += length
+                    head = awkward.util.numpy.where(negative, head + length, head)
                 if not awkward.util.numpy.bitwise_and(0 <= head, head < length).all():
                     raise IndexError("some indexes out of bounds for length {0}".format(length))
 
@@ -402,8 +513,9 @@ class Table(awkward.array.base.AwkwardArray):
                     return head
 
                 elif isinstance(self._view, tuple):
+                    # compose arithmetically instead of materializing the whole strided view
                     mystart, mystep, mylength = self._view
-                    return awkward.util.numpy.arange(mystart, mystart + mystep*mylength, mystep)[head]
+                    return mystart + mystep*head
 
                 else:
                     return self._view[head]
@@ -414,11 +526,12 @@ class Table(awkward.array.base.AwkwardArray):
                     raise IndexError("boolean index of length {0} does not fit array of length {1}".format(len(head), length))
 
                 if self._view is None:
-                    return awkward.util.numpy.arange(length)[head]
+                    return awkward.util.numpy.nonzero(head)[0]
 
                 elif isinstance(self._view, tuple):
+                    # the mask is compressed to the positions it selects before they're mapped through the stride
                     mystart, mystep, mylength = self._view
-                    return awkward.util.numpy.arange(mystart, mystart + mystep*mylength, mystep)[head]
+                    return mystart + mystep*awkward.util.numpy.nonzero(head)[0]
 
                 else:
                     return self._view[head]
@@ -450,12 +563,8 @@ class Table(awkward.array.base.AwkwardArray):
     def __getitem__(self, where):
         if awkward.util.isstringslice(where):
             if isinstance(where, awkward.util.string):
-                index = self._index()
                 try:
-                    if index is None:
-                        return self._content[where]
-                    else:
-                        return self._content[where][index]
+                    return self._gather(where)
                 except KeyError:
                     raise ValueError("no column named {0}".format(repr(where)))
             else:
@@ -465,7 +574,9 @@ class Table(awkward.array.base.AwkwardArray):
                         content[n] = self._content[n]
                     except KeyError:
                         raise ValueError("no column named {0}".format(repr(n)))
-                return self.copy(content=content)
+                out = self.copy(content=content)
+                out._gathered = self._gathered    # same view, so the same gathered columns
+                return out
 
         if isinstance(where, tuple) and where == ():
             return self
@@ -491,6 +602,8 @@ class Table(awkward.array.base.AwkwardArray):
         if self._view is not None:
             raise ValueError("new columns can only be attached to the original Table, not a view (try table.base['col'] = array)")
 
+        self._gathered.clear()
+
         if isinstance(where, awkward.util.string):
             self._content[where] = awkward.util.toarray(what, awkward.util.DEFAULTTYPE)
 
@@ -507,6 +620,8 @@ class Table(awkward.array.base.AwkwardArray):
         if self._view is not None:
             raise ValueError("columns can only be removed from the original Table, not a view (try del table.base['col'])")
 
+        self._gathered.clear()
+
         if isinstance(where, awkward.util.string):
             del self._content[where]
         elif awkward.util.isstringslice(where):
@@ -532,29 +647,24 @@ class Table(awkward.array.base.AwkwardArray):
 
         assert inputsdict is not None
 
-        for x in inputs:
-            if isinstance(x, Table):
-                index = x._index()
-                for n, y in x._content.items():
-                    if index is None:
-                        inputsdict[n].append(y)
-                    else:
-                        inputsdict[n].append(y[index])
-            else:
-                for n in inputsdict:
-                    inputsdict[n].append(x)
+        # a column that isn't materialized yet becomes a VirtualArray, so only the result columns that are accessed are read
+        lazy = ufunc.nout == 1 and "out" not in kwargs and not awkward.util.iscomparison(ufunc)
 
         newcolumns = {}
         tuplelen = None
-        for n, x in inputsdict.items():
-            newcolumns[n] = getattr(ufunc, method)(*x, **kwargs)
+        for n in inputsdict:
+            if lazy and any(isinstance(x, Table) and isinstance(x._content[n], awkward.array.virtual.VirtualArray) and not x._content[n].ismaterialized for x in inputs):
+                args = [(x._content[n], x._index()) if isinstance(x, Table) else (x, None) for x in inputs]
+                newcolumns[n] = awkward.array.virtual.VirtualArray(_lazyufunc, (ufunc, args, kwargs), type=_lazytype(table, ufunc, args, kwargs))
+            else:
+                newcolumns[n] = getattr(ufunc, method)(*[x._gather(n) if isinstance(x, Table) else x for x in inputs], **kwargs)
 
             if tuplelen is None:
-                if isinstance(x, tuple):
-                    tuplelen = len(x)
+                if isinstance(newcolumns[n], tuple):
+                    tuplelen = len(newcolumns[n])
                 else:
                     tuplelen = False
-            elif isinstance(x, tuple) != tuplelen:
+            elif isinstance(newcolumns[n], tuple) != (tuplelen is not False):
                 raise AssertionError("ufuncs return tuples of different lengths or some tuples and some non-tuples")
 
         assert len(newcolumns) != 0
@@ -585,7 +695,7 @@ class Table(awkward.array.base.AwkwardArray):
             out = [table.empty_like() for i in range(tuplelen)]
             for n in inputsdict:
                 for i in range(tuplelen):
-                    out[i][n] = newcolumns[n]
+                    out[i][n] = newcolumns[n][i]
             return tuple(out)
 
     def any(self):
@@ -613,3 +723,26 @@ class Table(awkward.array.base.AwkwardArray):
     def pandas(self):
         import pandas
         return pandas.DataFrame(self._content)
+
+def _lazyufunc(ufunc, args, kwargs):
+    # generator for lazy Table ufunc columns: args are (column, index) pairs for Tables and (value, None) for anything else
+    return ufunc(*[x if index is None else x[index] for x, index in args], **kwargs)
+
+def _lazytype(table, ufunc, args, kwargs):
+    # the result type without materializing anything: the ufunc applied to empty arrays of the columns' dtypes
+    dummies = []
+    for x, index in args:
+        if isinstance(x, awkward.array.virtual.VirtualArray):
+            if x._type is None or not isinstance(x._type.to, awkward.util.numpy.dtype):
+                return None
+            dummies.append(awkward.util.numpy.empty(0, dtype=x._type.to))
+        elif isinstance(x, awkward.util.numpy.ndarray):
+            if len(x.shape) != 1:
+                return None
+            dummies.append(x[:0])
+        elif isinstance(x, awkward.array.base.AwkwardArray):
+            return None
+        else:
+            dummies.append(x)
+
+    return awkward.type.ArrayType(len(table), ufunc(*dummies, **kwargs).dtype)
@@ -37,6 +37,8 @@ class UnionArray(awkward.array.base.AwkwardArray):
     UnionArray
     """
 
+    _iterblocksize = 65536    # rows gathered at a time by __iter__
+
     def __init__(self, tags, index, contents):
         self.tags = tags
         self.index = index
@@ -66,6 +68,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
         out._contents = self._contents
         out._dtype = self._dtype
         out._isvalid = self._isvalid
+        out._distincttags = self._distincttags
         if tags is not None:
             out.tags = tags
         if index is not None:
@@ -93,12 +96,36 @@ class UnionArray(awkward.array.base.AwkwardArray):
     @property
     def issequential(self):
         self._valid()
-        for tag in awkward.util.numpy.unique(self._tags):
-            mask = self._tags == tag
-            if not awkward.util.numpy.array_equal(self._index[mask], awkward.util.numpy.arange(awkward.util.numpy.count_nonzero(mask))):
+        index = self._index[:len(self._tags)].reshape(-1)
+        for tag, positions in self._groups():
+            if not awkward.util.numpy.array_equal(index[positions], awkward.util.numpy.arange(len(positions))):
                 return False
         return True
 
+    def _uniquetags(self):
+        # cached because _valid, __getitem__ and __setitem__ all need it
+        if self._distincttags is None:
+            self._distincttags = awkward.util.numpy.unique(self._tags)
+        return self._distincttags
+
+    def _groups(self, start=0, stop=None):
+        # positions of each distinct tag in the flattened tags[start:stop], in order, from one stable argsort: [(tag, positions), ...]
+        tags = self._tags.reshape(-1)[start:stop]
+        order = awkward.util.numpy.argsort(tags, kind="mergesort")
+        counts = awkward.util.numpy.bincount(tags, minlength=len(self._contents))
+        offsets = awkward.util.numpy.empty(len(counts) + 1, dtype=awkward.util.INDEXTYPE)
+        offsets[0] = 0
+        awkward.util.numpy.cumsum(counts, out=offsets[1:])
+        distinct = awkward.util.numpy.nonzero(counts)[0]
+        if self._distincttags is None and start == 0 and stop is None:
+            self._distincttags = distinct.astype(self._tags.dtype)
+        return [(tag, order[offsets[tag]:offsets[tag + 1]]) for tag in distinct]
+
+    def _gather(self, groups, start=0, stop=None):
+        # each content, gathered once for the positions (relative to start) that refer to it: [(positions, content items), ...]
+        index = self._index[:len(self._tags)].reshape(-1)[start:stop]
+        return [(positions, self._contents[tag][index[positions]]) for tag, positions in groups]
+
     def __awkward_persist__(self, ident, fill, prefix, suffix, schemasuffix, storage, compression, **kwargs):
         self._valid()
         if self.issequential:
@@ -126,6 +153,7 @@ class UnionArray(awkward.array.base.AwkwardArray):
         if (value < 0).any():
             raise ValueError("tags must be a non-negative array")
         self._tags = value
+        self._distincttags = None
         self._isvalid = False
 
     @property
@@ -244,9 +272,9 @@ class UnionArray(awkward.array.base.AwkwardArray):
             if len(self._tags.reshape(-1)) > 0 and self._tags.reshape(-1).max() >= len(self._contents):
                 raise ValueError("maximum tag is {0} but there are only {1} contents arrays".format(self._tags.reshape(-1).max(), len(self._contents)))
 
-            index = self._index[:len(self._tags)]
-            for tag in awkward.util.numpy.unique(self._tags):
-                maxindex = index[self._tags == tag].reshape(-1).max()
+            index = self._index[:len(self._tags)].reshape(-1)
+            for tag, positions in self._groups():
+                maxindex = index[positions].max()
                 if maxindex >= len(self._contents[tag]):
                     raise ValueError("maximum index ({0}) must be less than the length of all contents arrays ({1})".format(maxindex, len(self._contents[tag])))
 
@@ -254,23 +282,93 @@ class UnionArray(awkward.array.base.AwkwardArray):
 
     def __iter__(self):
         self._valid()
+        if len(self._tags.shape) != 1:
+            for i in range(len(self._tags)):
+                yield self[i]
+            return
+
+        # blocks of rows are gathered per content in bulk and scattered back into row order
+        for start in range(0, len(self._tags), self._iterblocksize):
+            stop = min(start + self._iterblocksize, len(self._tags))
+            out = [None] * (stop - start)
+            for positions, items in self._gather(self._groups(start, stop), start, stop):
+                for i, x in zip(positions, items):
+                    out[i] = x
+            for x in out:
+                yield x
+
+    def tolist(self):
+        self._valid()
+        if len(self._tags.shape) != 1:
+            return super(UnionArray, self).tolist()
+
+        out = [None] * len(self._tags)
+        for positions, items in self._gather(self._groups()):
+            for i, x in zip(positions.tolist(), self._try_tolist(items)):
+                out[i] = x
+        return out
 
-        tags = self._tags
-        lentags = len(self._tags)
-        index = self._index
-        contents = self._contents
+    def simplify(self):
+        self._valid()
+        gathered = self._gather(self._groups())
+        if len(gathered) == 0:
+            return self._contents[0][:0]
+
+        buckets = []
+        for positions, items in gathered:
+            for bucket in buckets:
+                other = bucket[0][1]
+                if isinstance(items, awkward.util.numpy.ndarray) and isinstance(other, awkward.util.numpy.ndarray) and items.dtype == other.dtype and items.shape[1:] == other.shape[1:]:
+                    bucket.append((positions, items))
+                    break
+            else:
+                buckets.append([(positions, items)])
+
+        if len(buckets) == 1:
+            if len(gathered) == 1:
+                positions, items = gathered[0]    # the only tag, so positions are all rows in order
+                if len(self._tags.shape) != 1:
+                    items = items.reshape(self._tags.shape + items.shape[1:])
+                return items
+            out = awkward.util.numpy.empty((len(self._tags.reshape(-1)),) + gathered[0][1].shape[1:], dtype=gathered[0][1].dtype)
+            for positions, items in gathered:
+                out[positions] = items
+            return out.reshape(self._tags.shape + out.shape[1:])
+
+        tags = awkward.util.numpy.empty(len(self._tags.reshape(-1)), dtype=awkward.util.TAGTYPE)
+        index = awkward.util.numpy.empty(len(tags), dtype=awkward.util.INDEXTYPE)
+        contents = []
+        for tag, bucket in enumerate(buckets):
+            offset = 0
+            for positions, items in bucket:
+                tags[positions] = tag
+                index[positions] = awkward.util.numpy.arange(offset, offset + len(positions))
+                offset += len(positions)
+            if len(bucket) == 1:
+                contents.append(bucket[0][1])
+            else:
+                contents.append(awkward.util.numpy.concatenate([items for positions, items in bucket]))
 
-        i = 0
-        while i < lentags:
-            yield contents[tags[i]][index[i]]
-            i += 1
+        return self.copy(tags=tags.reshape(self._tags.shape), index=index.reshape(self._tags.shape), contents=contents)
+
+    @property
+    def dense(self):
+        self._valid()
+        if not all(isinstance(x, awkward.util.numpy.ndarray) for x in self._contents):
+            raise TypeError("UnionArray with non-Numpy contents cannot be made dense")
+        out = awkward.util.numpy.empty(len(self._tags.reshape(-1)), dtype=self.dtype)
+        for positions, items in self._gather(self._groups()):
+            if len(items.shape) != 1:
+                raise TypeError("UnionArray with multidimensional contents cannot be made dense")
+            out[positions] = items
+        return out.reshape(self._tags.shape)
 
     def __getitem__(self, where):
         self._valid()
 
         if awkward.util.isstringslice(where):
             contents = []
-            for tag in awkward.util.numpy.unique(self._tags):
+            for tag in self._uniquetags():
                 contents.append(self._contents[tag][where])
             if len(contents) == 0:
                 return self.copy(contents=[self._contents[0][where]])
@@ -303,14 +401,14 @@ class UnionArray(awkward.array.base.AwkwardArray):
             raise ValueError("array to assign does not have the same starting shape as tags")
 
         if isinstance(where, awkward.util.string):
-            for tag in awkward.util.numpy.unique(self._tags):
+            for tag in self._uniquetags():
                 inverseindex = awkward.array.index.invert(self._index[:len(self._tags)][self._tags == tag])
                 self._contents[tag][where] = awkward.array.index.IndexedArray(inverseindex, what)
 
         elif awkward.util.isstringslice(where):
             if len(where) != len(what):
                 raise ValueError("number of keys ({0}) does not match number of provided arrays ({1})".format(len(where), len(what)))
-            for tag in awkward.util.numpy.unique(self._tags):
+            for tag in self._uniquetags():
                 inverseindex = awkward.array.index.invert(self._index[:len(self._tags)][self._tags == tag])
                 for x, y in zip(where, what):
                     self._contents[tag][x] = awkward.array.index.IndexedArray(inverseindex, y)
@@ -320,11 +418,11 @@ class UnionArray(awkward.array.base.AwkwardArray):
 
     def __delitem__(self, where):
         if isinstance(where, awkward.util.string):
-            for tag in awkward.util.numpy.unique(self._tags):
+            for tag in self._uniquetags():
                 del self._contents[tag][where]
 
         elif awkward.util.isstringslice(where):
-            for tag in awkward.util.numpy.unique(self._tags):
+            for tag in self._uniquetags():
                 for x in where:
                     del self._contents[tag][x]
 
@@ -347,20 +445,38 @@ class UnionArray(awkward.array.base.AwkwardArray):
         if any(x.shape != tags[0].shape for x in tags[1:]):
             raise ValueError("cannot {0} UnionArrays because tag shapes differ".format(ufunc))
 
-        combos = awkward.util.numpy.stack(tags, axis=-1).view([(str(i), x.dtype) for i, x in enumerate(tags)]).reshape(tags[0].shape)
-
-        outtags = awkward.util.numpy.empty(tags[0].shape, dtype=awkward.util.TAGTYPE)
-        outindex = awkward.util.numpy.empty(tags[0].shape, dtype=awkward.util.INDEXTYPE)
+        # one combined tag per row (the tags of all UnionArray inputs), grouped with one stable argsort
+        combos = awkward.util.numpy.zeros(len(tags[0].reshape(-1)), dtype=awkward.util.INDEXTYPE)
+        unions = [x for x in inputs if isinstance(x, UnionArray)]
+        for x in unions:
+            combos *= len(x._contents)
+            combos += x._tags.reshape(-1)
+        order = awkward.util.numpy.argsort(combos, kind="mergesort")
+        sortedcombos = combos[order]
+        starts = awkward.util.numpy.nonzero(awkward.util.numpy.concatenate([[True], sortedcombos[1:] != sortedcombos[:-1]]))[0] if len(order) > 0 else awkward.util.numpy.empty(0, dtype=awkward.util.INDEXTYPE)
+        stops = awkward.util.numpy.append(starts[1:], len(order))
+
+        outtags = awkward.util.numpy.empty(len(combos), dtype=awkward.util.TAGTYPE)
+        outindex = awkward.util.numpy.empty(len(combos), dtype=awkward.util.INDEXTYPE)
+        indexes = [x._index[:len(x._tags)].reshape(-1) for x in unions]
 
         out = None
         contents = {}
         types = {}
-        for outtag, combo in enumerate(awkward.util.numpy.unique(combos)):
-            mask = (combos == combo)
-            outtags[mask] = outtag
-            outindex[mask] = awkward.util.numpy.arange(awkward.util.numpy.count_nonzero(mask))
-
-            result = getattr(ufunc, method)(*[x[mask] if isinstance(x, UnionArray) else x for x in inputs], **kwargs)
+        for outtag, (start, stop) in enumerate(zip(starts, stops)):
+            positions = order[start:stop]
+            outtags[positions] = outtag
+            outindex[positions] = awkward.util.numpy.arange(len(positions))
+
+            args = []
+            i = 0
+            for x in inputs:
+                if isinstance(x, UnionArray):
+                    args.append(x._contents[x._tags.reshape(-1)[positions[0]]][indexes[i][positions]])
+                    i += 1
+                else:
+                    args.append(x)
+            result = getattr(ufunc, method)(*args, **kwargs)
 
             if isinstance(result, tuple):
                 if out is None:
@@ -384,30 +500,22 @@ class UnionArray(awkward.array.base.AwkwardArray):
 
         if out is None:
             if None in contents:
-                return awkward.array.objects.Methods.maybemixin(types[None], UnionArray)(outtags, outindex, contents[None])
+                return awkward.array.objects.Methods.maybemixin(types[None], UnionArray)(outtags.reshape(tags[0].shape), outindex.reshape(tags[0].shape), contents[None])
             else:
                 return None
         else:
             for i in range(len(out)):
                 if i in contents:
-                    out[i] = awkward.array.objects.Methods.maybemixin(types[i], UnionArray)(outtags, outindex, contents[i])
+                    out[i] = awkward.array.objects.Methods.maybemixin(types[i], UnionArray)(outtags.reshape(tags[0].shape), outindex.reshape(tags[0].shape), contents[i])
             return tuple(out)
 
     def any(self):
         self._valid()
-        index = self._index[:len(self._tag)]
-        for tag in awkward.util.numpy.unique(self._tags):
-            if self._contents[tag][index[self._tags == tag]].any():
-                return True
-        return False
+        return any(items.any() for positions, items in self._gather(self._groups()))
 
     def all(self):
         self._valid()
-        index = self._index[:len(self._tag)]
-        for tag in awkward.util.numpy.unique(self._tags):
-            if not self._contents[tag][index[self._tags == tag]].all():
-                return False
-        return True
+        return all(items.all() for positions, items in self._gather(self._groups()))
 
     @classmethod
     def concat(cls, first, *rest):
@@ -42,9 +42,23 @@ import awkward.util
 
 ARROW_BITMASKTYPE = awkward.util.numpy.uint8
 ARROW_INDEXTYPE = awkward.util.numpy.int32
+ARROW_LARGEINDEXTYPE = awkward.util.numpy.int64
 ARROW_TAGTYPE = awkward.util.numpy.uint8
 ARROW_CHARTYPE = awkward.util.numpy.uint8
 
+def _largelisttype():
+    import pyarrow
+    # LargeListType (64-bit offsets) is only in newer versions of pyarrow; () matches no instances
+    return getattr(pyarrow.lib, "LargeListType", ())
+
+def _islargestring(tpe):
+    import pyarrow
+    return hasattr(pyarrow, "large_string") and tpe == pyarrow.large_string()
+
+def _islargebinary(tpe):
+    import pyarrow
+    return hasattr(pyarrow, "large_binary") and tpe == pyarrow.large_binary()
+
 def schema2type(schema):
     import pyarrow
 
@@ -69,7 +83,7 @@ def schema2type(schema):
             else:
                 return out
 
-        elif isinstance(tpe, pyarrow.lib.ListType):
+        elif isinstance(tpe, (pyarrow.lib.ListType, _largelisttype())):
             out = awkward.type.ArrayType(float("inf"), recurse(tpe.value_type, nullable))
             if nullable:
                 return awkward.type.OptionType(out)
@@ -89,13 +103,13 @@ def schema2type(schema):
             else:
                 return out
 
-        elif tpe == pyarrow.string():
+        elif tpe == pyarrow.string() or _islargestring(tpe):
             if nullable:
                 return awkward.type.OptionType(str)
             else:
                 return str
 
-        elif tpe == pyarrow.binary():
+        elif tpe == pyarrow.binary() or _islargebinary(tpe):
             if nullable:
                 return awkward.type.OptionType(bytes)
             else:
@@ -128,13 +142,24 @@ def schema2type(schema):
 
     return out
 
+def unpackbools(bits, length):
+    return awkward.array.masked.BitMaskedArray.bit2bool(bits, lsborder=True)[:length]
+
 def view(obj):
     import pyarrow
 
-    def popbuffers(tpe, buffers):
+    def popmask(out, buffers):
+        mask = buffers.pop()
+        if mask is not None:
+            mask = awkward.util.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)[:awkward.array.masked.BitMaskedArray._ceildiv8(len(out))]
+            return awkward.array.masked.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
+        else:
+            return out
+
+    def popbuffers(tpe, buffers, length):
         if isinstance(tpe, pyarrow.lib.DictionaryType):
             content = view(tpe.dictionary)
-            index = popbuffers(tpe.index_type, buffers)
+            index = popbuffers(tpe.index_type, buffers, length)
             if isinstance(index, awkward.array.masked.BitMaskedArray):
                 return awkward.array.masked.BitMaskedArray(index.mask, awkward.array.indexed.IndexedArray(index.content, content), maskedwhen=index.maskedwhen, lsborder=index.lsborder)
             else:
@@ -143,103 +168,69 @@ def view(obj):
         elif isinstance(tpe, pyarrow.lib.StructType):
             pairs = []
             for i in range(tpe.num_children - 1, -1, -1):
-                pairs.insert(0, (tpe[i].name, popbuffers(tpe[i].type, buffers)))
+                pairs.insert(0, (tpe[i].name, popbuffers(tpe[i].type, buffers, length)))
             out = awkward.array.table.Table.frompairs(pairs)
-            mask = buffers.pop()
-            if mask is not None:
-                mask = awkward.util.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkward.array.masked.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+            return popmask(out, buffers)
 
-        elif isinstance(tpe, pyarrow.lib.ListType):
-            content = popbuffers(tpe.value_type, buffers)
-            offsets = awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_INDEXTYPE)
+        elif isinstance(tpe, (pyarrow.lib.ListType, _largelisttype())):
+            # offsets are viewed at their Arrow width (32-bit or 64-bit), never widened
+            content = popbuffers(tpe.value_type, buffers, None)
+            offsets = awkward.util.numpy.frombuffer(buffers.pop(), dtype=(ARROW_INDEXTYPE if isinstance(tpe, pyarrow.lib.ListType) else ARROW_LARGEINDEXTYPE))
             out = awkward.array.jagged.JaggedArray.fromoffsets(offsets, content)
-            mask = buffers.pop()
-            if mask is not None:
-                mask = awkward.util.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkward.array.masked.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+            return popmask(out, buffers)
 
         elif isinstance(tpe, pyarrow.lib.UnionType) and tpe.mode == "sparse":
             contents = []
             for i in range(tpe.num_children - 1, -1, -1):
-                contents.insert(0, popbuffers(tpe[i].type, buffers))
+                contents.insert(0, popbuffers(tpe[i].type, buffers, length))
             assert buffers.pop() is None
             tags = awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_TAGTYPE)
             index = awkward.util.numpy.arange(len(tags), dtype=ARROW_INDEXTYPE)
             out = awkward.array.union.UnionArray(tags, index, contents)
-            mask = buffers.pop()
-            if mask is not None:
-                mask = awkward.util.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkward.array.masked.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+            return popmask(out, buffers)
 
         elif isinstance(tpe, pyarrow.lib.UnionType) and tpe.mode == "dense":
             contents = []
             for i in range(tpe.num_children - 1, -1, -1):
-                contents.insert(0, popbuffers(tpe[i].type, buffers))
+                contents.insert(0, popbuffers(tpe[i].type, buffers, None))
             index = awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_INDEXTYPE)
             tags = awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_TAGTYPE)
             out = awkward.array.union.UnionArray(tags, index, contents)
-            mask = buffers.pop()
-            if mask is not None:
-                mask = awkward.util.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkward.array.masked.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+            return popmask(out, buffers)
 
-        elif tpe == pyarrow.string():
+        elif tpe == pyarrow.string() or _islargestring(tpe):
             content = awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_CHARTYPE)
-            offsets = awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_INDEXTYPE)
+            offsets = awkward.util.numpy.frombuffer(buffers.pop(), dtype=(ARROW_INDEXTYPE if tpe == pyarrow.string() else ARROW_LARGEINDEXTYPE))
             out = awkward.derived.strings.StringArray.fromoffsets(offsets, content, encoding="utf-8")
-            mask = buffers.pop()
-            if mask is not None:
-                mask = awkward.util.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkward.array.masked.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+            return popmask(out, buffers)
 
-        elif tpe == pyarrow.binary():
+        elif tpe == pyarrow.binary() or _islargebinary(tpe):
             content = awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_CHARTYPE)
-            offsets = awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_INDEXTYPE)
+            offsets = awkward.util.numpy.frombuffer(buffers.pop(), dtype=(ARROW_INDEXTYPE if tpe == pyarrow.binary() else ARROW_LARGEINDEXTYPE))
             out = awkward.derived.strings.StringArray.fromoffsets(offsets, content, encoding=None)
-            mask = buffers.pop()
-            if mask is not None:
-                mask = awkward.util.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkward.array.masked.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+            return popmask(out, buffers)
 
         elif tpe == pyarrow.bool_():
-            out = awkward.util.numpy.unpackbits(awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_CHARTYPE)).view(awkward.util.BOOLTYPE)
-            out = out.reshape(-1, 8)[:,::-1].reshape(-1)    # lsborder=True
-            mask = buffers.pop()
-            if mask is not None:
-                mask = awkward.util.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkward.array.masked.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+            # keep the bits packed until something actually needs one byte per boolean
+            bits = awkward.util.numpy.frombuffer(buffers.pop(), dtype=ARROW_CHARTYPE)
+            if length is None:
+                length = 8*len(bits)
+            out = awkward.array.virtual.VirtualArray(unpackbools, (bits, length), type=awkward.type.ArrayType(length, awkward.util.BOOLTYPE), persistvirtual=False)
+            return popmask(out, buffers)
 
         elif isinstance(tpe, pyarrow.lib.DataType):
             out = awkward.util.numpy.frombuffer(buffers.pop(), dtype=tpe.to_pandas_dtype())
-            mask = buffers.pop()
-            if mask is not None:
-                mask = awkward.util.numpy.frombuffer(mask, dtype=ARROW_BITMASKTYPE)
-                return awkward.array.masked.BitMaskedArray(mask, out, maskedwhen=False, lsborder=True)
-            else:
-                return out
+            return popmask(out, buffers)
 
         else:
             raise NotImplementedError(repr(tpe))
 
     if isinstance(obj, pyarrow.lib.Array):
         buffers = obj.buffers()
-        out = popbuffers(obj.type, buffers)[:len(obj)]
+        out = popbuffers(obj.type, buffers, len(obj))
         assert len(buffers) == 0
+        if len(out) != len(obj):
+            out = out[:len(obj)]
         return out
 
     elif isinstance(obj, pyarrow.lib.ChunkedArray):
@@ -48,6 +48,18 @@ class StringMethods(object):
                 raise ValueError("invalid number of arguments")
             left, right = inputs[0], inputs[1]
 
+            if isinstance(left, StringMethods) and isinstance(right, (str, bytes)):
+                out = left._equalliteral(right)
+            elif isinstance(right, StringMethods) and isinstance(left, (str, bytes)):
+                out = right._equalliteral(left)
+            else:
+                out = None
+            if out is not None:
+                if ufunc is awkward.util.numpy.equal:
+                    return out
+                else:
+                    return awkward.util.numpy.logical_not(out)
+
             if isinstance(left, (str, bytes)):
                 left = StringArray.fromstr(len(right), left)
             elif isinstance(left, awkward.util.numpy.ndarray) and (left.dtype.kind == "U" or left.dtype.kind == "S"):
@@ -71,27 +83,259 @@ class StringMethods(object):
 
             maybeequal = (left.counts == right.counts)
 
-            leftmask = left[maybeequal]
-            rightmask = right[maybeequal]
-
-            reallyequal = (leftmask == rightmask).count_nonzero() == leftmask.counts
-
             out = awkward.util.numpy.zeros(len(left), dtype=awkward.util.BOOLTYPE)
-            out[maybeequal] = reallyequal
+            if maybeequal.any():
+                leftmask = left[maybeequal]
+                rightmask = right[maybeequal]
+
+                reallyequal = (leftmask == rightmask).count_nonzero() == leftmask.counts
+                out[maybeequal] = reallyequal
 
             if ufunc is awkward.util.numpy.equal:
                 return out
             else:
                 return awkward.util.numpy.logical_not(out)
 
+        elif ufunc is awkward.util.numpy.add and len(inputs) == 2 and any(isinstance(x, StringMethods) for x in inputs):
+            for x in inputs:
+                if isinstance(x, StringMethods):
+                    encoding = x.encoding
+                    length = len(x)
+                    break
+            left, right = [x._flat() if isinstance(x, StringMethods) else StringMethods._flatliteral(length, x, encoding) for x in inputs]
+            return StringArray._concatenate(left, right, encoding)
+
         else:
             return super(StringMethods, self).__array_ufunc__(ufunc, method, *inputs, **kwargs)
 
+    def _encodeliteral(self, literal):
+        if isinstance(literal, bytes):
+            return literal
+        else:
+            return codecs.getencoder(self.encoding or "utf-8")(literal)[0]
+
+    def _equalliteral(self, literal):
+        # only strings with the literal's byte length need their bytes compared
+        literal = awkward.util.numpy.frombuffer(self._encodeliteral(literal), dtype=awkward.util.CHARTYPE)
+        out = (self.counts == len(literal))
+        if len(literal) != 0 and out.any():
+            data = self.content[self.starts[out].reshape(-1, 1) + awkward.util.numpy.arange(len(literal))]
+            out[out] = (data == literal).all(axis=1)
+        return out
+
+    def _flatindex(self, offsets, starts):
+        # positions in content of each string's bytes, laid end to end
+        return awkward.util.numpy.arange(offsets[-1]) + awkward.util.numpy.repeat(starts - offsets[:-1], offsets[1:] - offsets[:-1])
+
+    def _flat(self):
+        # offsets and content of the strings laid end to end (the content itself if it already is)
+        counts = self.counts
+        offsets = awkward.array.jagged.counts2offsets(counts)
+        starts = self.starts
+        if len(starts) == 0 or (starts[0] == 0 and awkward.util.numpy.array_equal(starts, offsets[:-1])):
+            return offsets, self.content[:offsets[-1]]
+        else:
+            return offsets, self.content[self._flatindex(offsets, starts)]
+
+    @staticmethod
+    def _flatliteral(length, literal, encoding):
+        if not isinstance(literal, bytes):
+            literal = codecs.getencoder(encoding or "utf-8")(literal)[0]
+        literal = awkward.util.numpy.frombuffer(literal, dtype=awkward.util.CHARTYPE)
+        offsets = awkward.util.numpy.arange(length + 1, dtype=awkward.util.INDEXTYPE) * len(literal)
+        return offsets, awkward.util.numpy.tile(literal, length)
+
+    def _codecname(self):
+        if self.encoding is None:
+            return None
+        else:
+            return codecs.lookup(self.encoding).name
+
+    def bytelength(self):
+        return self.counts
+
+    def length(self):
+        # number of code points, counted without decoding
+        name = self._codecname()
+        if name in (None, "ascii", "iso8859-1"):
+            return self.counts
+        elif name == "utf-8":
+            # every byte that is not a continuation byte (0b10xxxxxx) starts a code point
+            offsets, content = self._flat()
+            leading = (awkward.util.numpy.bitwise_and(content, 0xc0) != 0x80).astype(awkward.util.INDEXTYPE)
+            return awkward.array.jagged.JaggedArray.fromoffsets(offsets, leading).sum()
+        elif name == "utf-32-le":
+            return self.counts // 4
+        else:
+            raise NotImplementedError("length for encoding {0}".format(repr(self.encoding)))
+
+    def startswith(self, prefix):
+        prefix = awkward.util.numpy.frombuffer(self._encodeliteral(prefix), dtype=awkward.util.CHARTYPE)
+        out = (self.counts >= len(prefix))
+        if len(prefix) != 0 and out.any():
+            data = self.content[self.starts[out].reshape(-1, 1) + awkward.util.numpy.arange(len(prefix))]
+            out[out] = (data == prefix).all(axis=1)
+        return out
+
+    def endswith(self, suffix):
+        suffix = awkward.util.numpy.frombuffer(self._encodeliteral(suffix), dtype=awkward.util.CHARTYPE)
+        out = (self.counts >= len(suffix))
+        if len(suffix) != 0 and out.any():
+            data = self.content[self.stops[out].reshape(-1, 1) - len(suffix) + awkward.util.numpy.arange(len(suffix))]
+            out[out] = (data == suffix).all(axis=1)
+        return out
+
+    def contains(self, substring):
+        substring = awkward.util.numpy.frombuffer(self._encodeliteral(substring), dtype=awkward.util.CHARTYPE)
+        n = len(substring)
+        counts = self.counts
+        out = (counts >= n)
+        if n == 0 or not out.any():
+            return out
+
+        # match[k] is True if the substring occurs at position k of the flattened content
+        offsets, content = self._flat()
+        match = awkward.util.numpy.ones(len(content) - n + 1, dtype=awkward.util.BOOLTYPE)
+        for j in range(n):
+            match &= (content[j : len(content) - n + 1 + j] == substring[j])
+
+        # count matches that start and end within each string
+        cumulative = awkward.util.numpy.zeros(len(match) + 1, dtype=awkward.util.INDEXTYPE)
+        awkward.util.numpy.cumsum(match, out=cumulative[1:])
+        lo = offsets[:-1][out]
+        hi = offsets[1:][out] - n + 1
+        out[out] = (cumulative[hi] > cumulative[lo])
+        return out
+
+    def _casefold(self, first):
+        if self._codecname() not in (None, "ascii", "iso8859-1", "utf-8"):
+            raise NotImplementedError("ASCII case folding for encoding {0}".format(repr(self.encoding)))
+        # ASCII bytes never occur inside multibyte UTF-8 sequences, so they can be flipped in place
+        content = awkward.util.numpy.array(self.content)
+        mask = (content >= ord(first))
+        mask &= (content <= ord(first) + 25)
+        content[mask] ^= 0x20
+        return StringArray(self.starts, self.stops, content, self.encoding)
+
+    def lower(self):
+        return self._casefold("A")
+
+    def upper(self):
+        return self._casefold("a")
+
+    def hash(self):
+        # 64-bit polynomial hash of each string's bytes (arithmetic wraps modulo 2**64)
+        counts = self.counts
+        out = awkward.util.numpy.zeros(len(counts), dtype=awkward.util.numpy.uint64)
+        if len(counts) == 0:
+            return out
+        offsets, content = self._flat()
+        if offsets[-1] != 0:
+            content = content.astype(awkward.util.numpy.uint64)
+            powers = awkward.util.numpy.empty(counts.max(), dtype=awkward.util.numpy.uint64)
+            powers[0] = 1
+            powers[1:] = 1099511628211
+            awkward.util.numpy.cumprod(powers, out=powers)
+            fromend = awkward.util.numpy.repeat(offsets[1:] - 1, counts) - awkward.util.numpy.arange(offsets[-1])
+            content *= powers[fromend]
+            out += awkward.array.jagged.JaggedArray.fromoffsets(offsets, content).sum()
+        out ^= counts.astype(awkward.util.numpy.uint64) * awkward.util.numpy.uint64(14695981039346656037)
+        return out
+
+    def _sortgroups(self, width=32):
+        # MSD sort on fixed-width byte prefixes; only groups still tied are refined with the next prefix
+        counts = self.counts
+        starts = self.starts
+        content = self.content
+        perm = awkward.util.numpy.arange(len(counts), dtype=awkward.util.INDEXTYPE)
+        group = awkward.util.numpy.zeros(len(counts), dtype=awkward.util.INDEXTYPE)
+        active = awkward.util.numpy.arange(len(counts) if len(counts) > 1 else 0, dtype=awkward.util.INDEXTYPE)
+        offset = 0
+        while len(active) != 0:
+            items = perm[active]
+            remaining = awkward.util.numpy.clip(counts[items] - offset, 0, width)
+            size = remaining.max()
+            if size == 0:
+                break
+            inprefix = awkward.util.numpy.arange(size) < remaining.reshape(-1, 1)
+            where = awkward.util.numpy.where(inprefix, starts[items].reshape(-1, 1) + offset + awkward.util.numpy.arange(size), 0)
+            prefix = awkward.util.numpy.where(inprefix, content[where], 0).astype(awkward.util.CHARTYPE).view("S{0}".format(size)).reshape(-1)
+
+            # zero-padded prefixes tie with their own trailing zeros; the shorter string sorts first
+            if offset == 0:
+                order = awkward.util.numpy.lexsort((remaining, prefix))
+            else:
+                order = awkward.util.numpy.lexsort((remaining, prefix, group[active]))
+            perm[active] = items[order]
+            prefix = prefix[order]
+            remaining = remaining[order]
+
+            isfirst = awkward.util.numpy.empty(len(active), dtype=awkward.util.BOOLTYPE)
+            isfirst[0] = True
+            isfirst[1:] = (group[active][1:] != group[active][:-1]) | (prefix[1:] != prefix[:-1]) | (remaining[1:] != remaining[:-1])
+            group[active] = awkward.util.numpy.maximum.accumulate(awkward.util.numpy.where(isfirst, active, 0))
+
+            # continue with groups of two or more strings that all have bytes left
+            segment = awkward.util.numpy.cumsum(isfirst) - 1
+            size = awkward.util.numpy.bincount(segment)
+            active = active[(size[segment] > 1) & (remaining == width)]
+            offset += width
+
+        return perm, group
+
+    def argsort(self):
+        return self._sortgroups()[0]
+
+    def sort(self):
+        return self[self.argsort()]
+
+    def unique(self, return_index=False, return_inverse=False):
+        perm, group = self._sortgroups()
+        isfirst = awkward.util.numpy.ones(len(perm), dtype=awkward.util.BOOLTYPE)
+        isfirst[1:] = (group[1:] != group[:-1])
+        first = perm[isfirst]
+        out = (self[first],)
+        if return_index:
+            out = out + (first,)
+        if return_inverse:
+            inverse = awkward.util.numpy.empty(len(perm), dtype=awkward.util.INDEXTYPE)
+            inverse[perm] = awkward.util.numpy.cumsum(isfirst) - 1
+            out = out + (inverse,)
+        if len(out) == 1:
+            return out[0]
+        else:
+            return out
+
+    def categorize(self):
+        import awkward.array.indexed
+
+        if len(self) == 0:
+            return awkward.array.indexed.IndexedArray(awkward.util.numpy.empty(0, dtype=awkward.util.INDEXTYPE), self)
+
+        # unique strings by hash; equal hashes are then confirmed byte-for-byte
+        hashes = self.hash()
+        uniques, first, index = awkward.util.numpy.unique(hashes, return_index=True, return_inverse=True)
+        representative = first[index]
+        counts = self.counts
+        offsets = awkward.array.jagged.counts2offsets(counts)
+        if not (awkward.util.numpy.array_equal(counts[representative], counts) and
+                awkward.util.numpy.array_equal(self.content[self._flatindex(offsets, self.starts[representative])], self.content[self._flatindex(offsets, self.starts)])):
+            lookup = {}
+            index = awkward.util.numpy.array([lookup.setdefault(x.tostring(), len(lookup)) for x in self._content], dtype=awkward.util.INDEXTYPE)
+            first = awkward.util.numpy.empty(len(lookup), dtype=awkward.util.INDEXTYPE)
+            first[index[::-1]] = awkward.util.numpy.arange(len(index) - 1, -1, -1)
+
+        # number the categories in order of first appearance
+        order = awkward.util.numpy.argsort(first)
+        rank = awkward.util.numpy.empty(len(order), dtype=awkward.util.INDEXTYPE)
+        rank[order] = awkward.util.numpy.arange(len(order))
+        return awkward.array.indexed.IndexedArray(rank[index], self[first[order]])
+
 def tostring(x, decoder):
     if decoder is None:
         return x.tostring()
     else:
-        return decoder(x, errors="replace")[0]
+        return decoder(x, "replace")[0]
 
 class StringArray(StringMethods, awkward.array.objects.ObjectArray):
     """
@@ -109,13 +353,28 @@ class StringArray(StringMethods, awkward.array.objects.ObjectArray):
         if encoding is not None:
             encoder = codecs.getencoder(encoding)
             string = encoder(string)[0]
-        content = awkward.util.numpy.empty(length * len(string), dtype=awkward.util.CHARTYPE)
-        for i, x in string:
-            content[0::length] = ord(x)
+        content = awkward.util.numpy.tile(awkward.util.numpy.frombuffer(string, dtype=awkward.util.CHARTYPE), length)
         counts = awkward.util.numpy.empty(length, dtype=awkward.util.INDEXTYPE)
-        counts[:] = length
+        counts[:] = len(string)
         return cls.fromcounts(counts, content, encoding)
 
+    @classmethod
+    def _concatenate(cls, left, right, encoding):
+        # elementwise concatenation of two (offsets, content) pairs of the same length
+        leftoffsets, leftcontent = left
+        rightoffsets, rightcontent = right
+        leftcounts = leftoffsets[1:] - leftoffsets[:-1]
+        rightcounts = rightoffsets[1:] - rightoffsets[:-1]
+        if len(leftcounts) != len(rightcounts):
+            raise ValueError("cannot concatenate {0} strings with {1} strings".format(len(leftcounts), len(rightcounts)))
+
+        counts = leftcounts + rightcounts
+        offsets = awkward.array.jagged.counts2offsets(counts)
+        content = awkward.util.numpy.empty(offsets[-1], dtype=awkward.util.CHARTYPE)
+        content[awkward.util.numpy.arange(leftoffsets[-1]) + awkward.util.numpy.repeat(offsets[:-1] - leftoffsets[:-1], leftcounts)] = leftcontent[:leftoffsets[-1]]
+        content[awkward.util.numpy.arange(rightoffsets[-1]) + awkward.util.numpy.repeat(offsets[:-1] + leftcounts - rightoffsets[:-1], rightcounts)] = rightcontent[:rightoffsets[-1]]
+        return cls.fromoffsets(offsets, content, encoding)
+
     @classmethod
     def fromnumpy(cls, array):
         if array.dtype.kind == "S":
@@ -155,17 +414,29 @@ class StringArray(StringMethods, awkward.array.objects.ObjectArray):
         
     @classmethod
     def fromiter(cls, iterable, encoding="utf-8"):
-        if encoding is None:
-            encoded = iterable
+        strings = list(iterable)
+        counts = awkward.util.numpy.fromiter((len(x) for x in strings), dtype=awkward.util.INDEXTYPE, count=len(strings))
+        name = None if encoding is None else codecs.lookup(encoding).name
+
+        if name is None:
+            content = awkward.util.numpy.frombuffer(b"".join(strings), dtype=awkward.util.CHARTYPE)
+
+        elif name in ("utf-8", "utf-32-le", "ascii", "iso8859-1"):
+            # encode everything at once and find each string's byte offsets from its code point offsets
+            content = awkward.util.numpy.frombuffer(codecs.getencoder(encoding)(u"".join(strings))[0], dtype=awkward.util.CHARTYPE)
+            if name == "utf-32-le":
+                counts *= 4
+            elif name == "utf-8" and len(content) != counts.sum():
+                leading = awkward.util.numpy.nonzero(awkward.util.numpy.bitwise_and(content, 0xc0) != 0x80)[0]
+                leading = awkward.util.numpy.append(leading, len(content))
+                return cls.fromoffsets(leading[awkward.array.jagged.counts2offsets(counts)], content, encoding)
+
         else:
             encoder = codecs.getencoder(encoding)
-            encoded = [encoder(x)[0] for x in iterable]
-        counts = [len(x) for x in encoded]
-        content = awkward.util.numpy.empty(sum(counts), dtype=awkward.util.CHARTYPE)
-        i = 0
-        for x in encoded:
-            content[i : i + len(x)] = awkward.util.numpy.frombuffer(x, dtype=awkward.util.CHARTYPE)
-            i += len(x)
+            encoded = [encoder(x)[0] for x in strings]
+            counts = awkward.util.numpy.fromiter((len(x) for x in encoded), dtype=awkward.util.INDEXTYPE, count=len(encoded))
+            content = awkward.util.numpy.frombuffer(b"".join(encoded), dtype=awkward.util.CHARTYPE)
+
         return cls.fromcounts(counts, content, encoding)
 
     @classmethod
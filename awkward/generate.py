@@ -28,458 +28,631 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import codecs
-import collections
+import json
+import math
 import numbers
 
-import awkward.array.base
+import awkward.type
 import awkward.util
-from awkward.array.chunked import ChunkedArray, AppendableArray
 from awkward.array.jagged import JaggedArray
-from awkward.array.masked import BitMaskedArray, IndexedMaskedArray
-from awkward.array.objects import ObjectArray
+from awkward.array.masked import MaskedArray, BitMaskedArray, IndexedMaskedArray
 from awkward.array.table import Table
 from awkward.array.union import UnionArray
-
-# FIXME: the following must be totally broken from upstream changes
-
-def fromiter(iterable, chunksize=1024, maskmissing=True, references=False):
-    if references:
-        raise NotImplementedError    # keep all ids in a hashtable to create pointers (IndexedArray)
-
-    tobytes = lambda x: x.tobytes()
-    tostring = lambda x: codecs.utf_8_decode(x.tobytes())[0]
-
-    def insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj):
-        if len(chunks) == 0 or offsets[-1] - offsets[-2] == len(chunks[-1]):
-            chunks.append(newchunk(obj))
-            offsets.append(offsets[-1])
-
-        if ismine(obj, chunks[-1]):
-            chunks[-1] = promote(obj, chunks[-1])
-            fillobj(obj, chunks[-1], offsets[-1] - offsets[-2])
-            offsets[-1] += 1
-
-        elif isinstance(chunks[-1], IndexedMaskedArray) and len(chunks[-1]._content) == 0:
-            chunks[-1]._content = newchunk(obj)
-
-            nextindex = chunks[-1]._nextindex
-            chunks[-1]._nextindex += 1
-            chunks[-1]._index[offsets[-1] - offsets[-2]] = nextindex
-
-            chunks[-1]._content = promote(obj, chunks[-1]._content)
-            fillobj(obj, chunks[-1]._content, nextindex)
-            offsets[-1] += 1
-
-        elif isinstance(chunks[-1], IndexedMaskedArray) and ismine(obj, chunks[-1]._content):
-            nextindex = chunks[-1]._nextindex
-            chunks[-1]._nextindex += 1
-            chunks[-1]._index[offsets[-1] - offsets[-2]] = nextindex
-
-            chunks[-1]._content = promote(obj, chunks[-1]._content)
-            fillobj(obj, chunks[-1]._content, nextindex)
-            offsets[-1] += 1
-
-        elif isinstance(chunks[-1], UnionArray) and any(isinstance(content, IndexedMaskedArray) and ismine(obj, content._content) for content in chunks[-1]._contents):
-            for tag in range(len(chunks[-1]._contents)):
-                if isinstance(chunks[-1]._contents[tag], IndexedMaskedArray) and ismine(obj, chunks[-1]._contents[tag]._content):
-                    nextindex_union = chunks[-1]._nextindex[tag]
-                    chunks[-1]._nextindex[tag] += 1
-
-                    nextindex_mask = chunks[-1]._contents[tag]._nextindex
-                    chunks[-1]._contents[tag]._nextindex += 1
-                    chunks[-1]._contents[tag]._index[nextindex_union] = nextindex_mask
-
-                    chunks[-1]._contents[tag]._content = promote(obj, chunks[-1]._contents[tag]._content)
-                    fillobj(obj, chunks[-1]._contents[tag]._content, nextindex_mask)
-
-                    chunks[-1]._tags[offsets[-1] - offsets[-2]] = tag
-                    chunks[-1]._index[offsets[-1] - offsets[-2]] = nextindex_union
-
-                    offsets[-1] += 1
-                    break
-
-        else:
-            if not isinstance(chunks[-1], UnionArray):
-                chunks[-1] = UnionArray(numpy.empty(chunksize, dtype=awkward.array.base.AwkwardArray.INDEXTYPE),
-                                        numpy.empty(chunksize, dtype=awkward.array.base.AwkwardArray.INDEXTYPE),
-                                        [chunks[-1]])
-                chunks[-1]._nextindex = [offsets[-1] - offsets[-2]]
-                chunks[-1]._tags[: offsets[-1] - offsets[-2]] = 0
-                chunks[-1]._index[: offsets[-1] - offsets[-2]] = numpy.arange(offsets[-1] - offsets[-2], dtype=awkward.array.base.AwkwardArray.INDEXTYPE)
-                chunks[-1]._contents = list(chunks[-1]._contents)
-
-            if not any(ismine(obj, content) for content in chunks[-1]._contents):
-                chunks[-1]._nextindex.append(0)
-                chunks[-1]._contents.append(newchunk(obj))
-
-            for tag in range(len(chunks[-1]._contents)):
-                if ismine(obj, chunks[-1]._contents[tag]):
-                    nextindex = chunks[-1]._nextindex[tag]
-                    chunks[-1]._nextindex[tag] += 1
-
-                    chunks[-1]._contents[tag] = promote(obj, chunks[-1]._contents[tag])
-                    fillobj(obj, chunks[-1]._contents[tag], nextindex)
-
-                    chunks[-1]._tags[offsets[-1] - offsets[-2]] = tag
-                    chunks[-1]._index[offsets[-1] - offsets[-2]] = nextindex
-
-                    offsets[-1] += 1
-                    break
-
-    def fill(obj, chunks, offsets):
-        if obj is None:
-            # anything with None -> IndexedMaskedArray
-
-            if len(chunks) == 0 or offsets[-1] - offsets[-2] == len(chunks[-1]):
-                chunks.append(IndexedMaskedArray(numpy.empty(chunksize, dtype=awkward.array.base.AwkwardArray.INDEXTYPE), []))
-                chunks[-1]._nextindex = 0
-                offsets.append(offsets[-1])
-
-            if isinstance(chunks[-1], UnionArray) and any(isinstance(content, IndexedMaskedArray) for content in chunks[-1]._contents):
-                for tag in range(len(chunks[-1]._contents)):
-                    if isinstance(chunks[-1]._contents[tag], IndexedMaskedArray):
-                        nextindex = chunks[-1]._nextindex[tag]
-                        chunks[-1]._nextindex[tag] += 1
-
-                        chunks[-1]._contents[tag]._index[nextindex] = chunks[-1]._contents[tag]._maskedwhen
-
-                        chunks[-1]._tags[offsets[-1] - offsets[-2]] = tag
-                        chunks[-1]._index[offsets[-1] - offsets[-2]] = nextindex
-
-                        offsets[-1] += 1
-                        break
-
-            else:
-                if not isinstance(chunks[-1], IndexedMaskedArray):
-                    chunks[-1] = IndexedMaskedArray(numpy.empty(chunksize, dtype=awkward.array.base.AwkwardArray.INDEXTYPE), chunks[-1])
-                    chunks[-1]._index[: offsets[-1] - offsets[-2]] = numpy.arange(offsets[-1] - offsets[-2], dtype=awkward.array.base.AwkwardArray.INDEXTYPE)
-                    chunks[-1]._nextindex = offsets[-1] - offsets[-2]
-
-                chunks[-1]._index[offsets[-1] - offsets[-2]] = chunks[-1]._maskedwhen
-                offsets[-1] += 1
-
-        elif isinstance(obj, (bool, numpy.bool, numpy.bool_)):
-            # bool -> Numpy bool_
-
-            def newchunk(obj):
-                return numpy.empty(chunksize, dtype=numpy.bool_)
-
-            def ismine(obj, x):
-                return isinstance(x, numpy.ndarray) and x.dtype == numpy.dtype(numpy.bool_)
-
-            def promote(obj, x):
-                return x
-
-            def fillobj(obj, array, where):
-                array[where] = obj
-
-            insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
-
-        elif isinstance(obj, (numbers.Integral, numpy.integer)):
-            # int -> Numpy int64, float64, or complex128 (promotes to largest)
-
-            def newchunk(obj):
-                return numpy.empty(chunksize, dtype=numpy.int64)
-
-            def ismine(obj, x):
-                return isinstance(x, numpy.ndarray) and issubclass(x.dtype.type, numpy.number)
-
-            def promote(obj, x):
-                return x
-
-            def fillobj(obj, array, where):
-                array[where] = obj
-
-            insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
-
-        elif isinstance(obj, (numbers.Real, numpy.floating)):
-            # float -> Numpy int64, float64, or complex128 (promotes to largest)
-
-            def newchunk(obj):
-                return numpy.empty(chunksize, dtype=numpy.int64)
-
-            def ismine(obj, x):
-                return isinstance(x, numpy.ndarray) and issubclass(x.dtype.type, numpy.number)
-
-            def promote(obj, x):
-                if issubclass(x.dtype.type, numpy.floating):
-                    return x
-                else:
-                    return x.astype(numpy.float64)
-
-            def fillobj(obj, array, where):
-                array[where] = obj
-
-            insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
-
-        elif isinstance(obj, (numbers.Complex, numpy.complex, numpy.complexfloating)):
-            # complex -> Numpy int64, float64, or complex128 (promotes to largest)
-
-            def newchunk(obj):
-                return numpy.empty(chunksize, dtype=numpy.complex128)
-
-            def ismine(obj, x):
-                return isinstance(x, numpy.ndarray) and issubclass(x.dtype.type, numpy.number)
-
-            def promote(obj, x):
-                if issubclass(x.dtype.type, numpy.complexfloating):
-                    return x
-                else:
-                    return x.astype(numpy.complex128)
-
-            def fillobj(obj, array, where):
-                array[where] = obj
-
-            insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
-
-        elif isinstance(obj, bytes):
-            # bytes -> ObjectArray of JaggedArray
-
-            def newchunk(obj):
-                out = ObjectArray(tobytes, JaggedArray.fromoffsets(
-                    numpy.zeros(chunksize + 1, dtype=awkward.array.base.AwkwardArray.INDEXTYPE),
-                    AppendableArray.empty(lambda: numpy.empty(chunksize, dtype=awkward.array.base.AwkwardArray.CHARTYPE))))
-                out._content._starts[0] = 0
-                return out
-
-            def ismine(obj, x):
-                return isinstance(x, ObjectArray) and (x._generator is tobytes or x._generator is tostring)
-
-            def promote(obj, x):
-                return x
-
-            def fillobj(obj, array, where):
-                array._content._stops[where] = array._content._starts[where] + len(obj)
-                array._content._content.extend(numpy.fromstring(obj, dtype=awkward.array.base.AwkwardArray.CHARTYPE))
-                
-            insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
-
-        elif isinstance(obj, awkward.util.string):
-            # str -> ObjectArray of JaggedArray
-
-            def newchunk(obj):
-                out = ObjectArray(tostring, JaggedArray.fromoffsets(
-                    numpy.zeros(chunksize + 1, dtype=awkward.array.base.AwkwardArray.INDEXTYPE),
-                    AppendableArray.empty(lambda: numpy.empty(chunksize, dtype=awkward.array.base.AwkwardArray.CHARTYPE))))
-                out._content._starts[0] = 0
-                return out
-
-            def ismine(obj, x):
-                return isinstance(x, ObjectArray) and (x._generator is tobytes or x._generator is tostring)
-
-            def promote(obj, x):
-                if x._generator is tostring:
-                    return x
-                else:
-                    return ObjectArray(tostring, x._content)
-
-            def fillobj(obj, array, where):
-                bytes = codecs.utf_8_encode(obj)[0]
-                array._content._stops[where] = array._content._starts[where] + len(bytes)
-                array._content._content.extend(numpy.fromstring(bytes, dtype=awkward.array.base.AwkwardArray.CHARTYPE))
-                
-            insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
-
+from awkward.derived.strings import StringArray
+
+################################################################ growable buffers
+
+class _Buffer(object):
+    # a Numpy array that doubles its capacity when full, so that appending is amortized O(1)
+
+    __slots__ = ["data", "length", "capacity"]
+
+    def __init__(self, dtype, capacity=1024):
+        self.capacity = max(capacity, 1)
+        self.data = awkward.util.numpy.empty(self.capacity, dtype=dtype)
+        self.length = 0
+
+    def _reserve(self, length):
+        if length > self.capacity:
+            while self.capacity < length:
+                self.capacity *= 2
+            data = awkward.util.numpy.empty(self.capacity, dtype=self.data.dtype)
+            data[:self.length] = self.data[:self.length]
+            self.data = data
+
+    def append(self, x):
+        if self.length == self.capacity:
+            self._reserve(self.length + 1)
+        self.data[self.length] = x
+        self.length += 1
+
+    def extend(self, array):
+        self._reserve(self.length + len(array))
+        self.data[self.length : self.length + len(array)] = array
+        self.length += len(array)
+
+    def astype(self, dtype):
+        self.data = self.data.astype(dtype)
+
+    def snapshot(self):
+        return self.data[:self.length]
+
+################################################################ type classification
+
+_NONE, _BOOL, _NUMBER, _BYTES, _STRING, _DICT, _TUPLE, _LIST = range(8)
+
+_kinds = {type(None): _NONE, bool: _BOOL, int: _NUMBER, float: _NUMBER, complex: _NUMBER, bytes: _BYTES, awkward.util.unicode: _STRING, dict: _DICT, tuple: _TUPLE, list: _LIST}
+
+def _kind(obj):
+    # cached by type because the isinstance chain is the slowest part of filling
+    cls = type(obj)
+    try:
+        return _kinds[cls]
+    except KeyError:
+        if isinstance(obj, (bool, awkward.util.numpy.bool_)):
+            out = _BOOL
+        elif isinstance(obj, (numbers.Number, awkward.util.numpy.number)):
+            out = _NUMBER
+        elif isinstance(obj, (bytes, bytearray, awkward.util.numpy.bytes_)):
+            out = _BYTES
+        elif isinstance(obj, awkward.util.unicode):
+            out = _STRING
         elif isinstance(obj, dict):
-            # dict keys -> Table columns
-
-            def newchunk(obj):
-                return Table(chunksize, collections.OrderedDict((n, []) for n in obj))
-
-            if maskmissing:
-                def ismine(obj, x):
-                    return isinstance(x, Table)
-
-                def promote(obj, x):
-                    for n in obj:
-                        if not n in x._content:
-                            x._content[n] = IndexedMaskedArray(numpy.empty(chunksize, dtype=awkward.array.base.AwkwardArray.INDEXTYPE), [])
-                            x._content[n]._index[: offsets[-1] - offsets[-2]] = x._content[n]._maskedwhen
-                            x._content[n]._nextindex = 0
-                    return x
-
-            else:
-                def ismine(obj, x):
-                    return isinstance(x, Table) and all(n in x._content for n in obj)
-
-                def promote(obj, x):
-                    return x
-
-            def fillobj(obj, array, where):
-                for n in obj:
-                    if len(array._content[n]) == 0:
-                        subchunks = []
-                        suboffsets = [offsets[-2]]
-                    else:
-                        subchunks = [array._content[n]]
-                        suboffsets = [offsets[-2], offsets[-1]]
-
-                    fill(obj[n], subchunks, suboffsets)
-                    array._content[n] = subchunks[-1]
-
-            insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
-
+            out = _DICT
         elif isinstance(obj, tuple):
-            # tuple items -> Table columns
-
-            def newchunk(obj):
-                return Table(chunksize, collections.OrderedDict(("_" + str(i), []) for i in range(len(obj))))
-
-            def ismine(obj, x):
-                return isinstance(x, Table) and list(x._content) == ["_" + str(i) for i in range(len(obj))]
-
-            def promote(obj, x):
-                return x
-
-            def fillobj(obj, array, where):
-                for i, x in enumerate(obj):
-                    n = "_" + str(i)
-                    if len(array._content[n]) == 0:
-                        subchunks = []
-                        suboffsets = [offsets[-2]]
-                    else:
-                        subchunks = [array._content[n]]
-                        suboffsets = [offsets[-2], offsets[-1]]
-
-                    fill(x, subchunks, suboffsets)
-                    array._content[n] = subchunks[-1]
-
-            insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
-
+            out = _TUPLE
         else:
             try:
-                it = iter(obj)
-
+                iter(obj)
             except TypeError:
-                # object attributes -> Table columns
-
-                def newchunk(obj):
-                    return NamedTable(chunksize, obj.__class__.__name__, collections.OrderedDict((n, []) for n in dir(obj) if not n.startswith("_")))
-
-                if maskmissing:
-                    def ismine(obj, x):
-                        return isinstance(x, NamedTable) and obj.__class__.__name__ == x._name
-
-                    def promote(obj, x):
-                        for n in dir(obj):
-                            if not n.startswith("_") and not n in x._content:
-                                x._content[n] = IndexedMaskedArray(numpy.empty(chunksize, dtype=awkward.array.base.AwkwardArray.INDEXTYPE), [])
-                                x._content[n]._index[: offsets[-1] - offsets[-2]] = x._content[n]._maskedwhen
-                                x._content[n]._nextindex = 0
-                        return x
-
-                else:
-                    def ismine(obj, x):
-                        return isinstance(x, NamedTable) and obj.__class__.__name__ == x._name and all(n in x._content for n in dir(obj) if not n.startswith("_"))
-
-                    def promote(obj, x):
-                        return x
-
-                def fillobj(obj, array, where):
-                    for n in dir(obj):
-                        if not n.startswith("_"):
-                            if len(array._content[n]) == 0:
-                                subchunks = []
-                                suboffsets = [offsets[-2]]
-                            else:
-                                subchunks = [array._content[n]]
-                                suboffsets = [offsets[-2], offsets[-1]]
-
-                            fill(getattr(obj, n), subchunks, suboffsets)
-                            array._content[n] = subchunks[-1]
-
-                insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
-
-            else:
-                # iterable -> JaggedArray (and recurse)
+                raise TypeError("cannot convert {0} to an array".format(repr(obj)))
+            out = _LIST
+        _kinds[cls] = out
+        return out
+
+_numberdtypes = [awkward.util.numpy.dtype(awkward.util.numpy.int64), awkward.util.numpy.dtype(awkward.util.numpy.float64), awkward.util.numpy.dtype(awkward.util.numpy.complex128)]
+_numberlevels = {int: 0, float: 1, complex: 2}
+
+_int64min = awkward.util.numpy.iinfo(awkward.util.numpy.int64).min
+_int64max = awkward.util.numpy.iinfo(awkward.util.numpy.int64).max
+
+def _numberlevel(obj):
+    # index into _numberdtypes, or None if obj is not a number (abstract isinstance checks are slow, so cache by type)
+    cls = type(obj)
+    try:
+        out = _numberlevels[cls]
+    except KeyError:
+        if _kind(obj) != _NUMBER:
+            out = None
+        elif isinstance(obj, (numbers.Integral, awkward.util.numpy.integer)):
+            out = 0
+        elif isinstance(obj, (numbers.Real, awkward.util.numpy.floating)):
+            out = 1
+        else:
+            out = 2
+        _numberlevels[cls] = out
+    if out == 0 and not _int64min <= int(obj) <= _int64max:
+        # integers that do not fit in int64 are promoted to float64, like Numpy does
+        return 1
+    return out
+
+def _fillablefor(obj, options):
+    kind = _kind(obj)
+    if kind == _BOOL:
+        return _BoolFillable(options)
+    elif kind == _NUMBER:
+        return _NumberFillable(options)
+    elif kind == _BYTES:
+        return _StringFillable(options, None)
+    elif kind == _STRING:
+        return _StringFillable(options, "utf-8")
+    elif kind == _DICT:
+        return _TableFillable(options)
+    elif kind == _TUPLE:
+        return _TupleFillable(options, len(obj))
+    elif kind == _LIST:
+        return _JaggedFillable(options)
+    else:
+        return _UnknownFillable(options)
+
+def _fillablefortype(tpe, options):
+    # prepare fillables for a declared type, so that filling does no inference or promotion
+    if isinstance(tpe, awkward.type.OptionType):
+        return _OptionFillable(options, _fillablefortype(tpe.type, options))
+
+    elif isinstance(tpe, awkward.type.UnionType):
+        if len(tpe) == 0:
+            raise ValueError("UnionType has no possibilities")
+        out = _UnionFillable(options, _fillablefortype(tpe[0], options))
+        for i in range(1, len(tpe)):
+            out.contents.append(_fillablefortype(tpe[i], options))
+        return out
+
+    elif isinstance(tpe, awkward.type.TableType):
+        out = _TableFillable(options)
+        for n in tpe.columns:
+            out.fields[n] = _fillablefortype(tpe[n], options)
+        return out
+
+    elif isinstance(tpe, awkward.type.ArrayType):
+        out = _JaggedFillable(options)
+        out.content = _fillablefortype(tpe.to, options)
+        return out
+
+    elif tpe is awkward.util.unicode:
+        return _StringFillable(options, "utf-8")
+
+    elif tpe is bytes:
+        return _StringFillable(options, None)
+
+    elif isinstance(tpe, awkward.util.numpy.dtype) and tpe.names is None and tpe.subdtype is None:
+        if issubclass(tpe.type, awkward.util.numpy.bool_):
+            return _BoolFillable(options)
+        elif issubclass(tpe.type, awkward.util.numpy.number):
+            return _NumberFillable(options, tpe)
+
+    raise TypeError("cannot fill type {0}".format(repr(tpe)))
+
+################################################################ fillables
+
+# Each fillable accumulates one type of data in columnar buffers.  fill(obj) returns the fillable
+# that should be used from then on: self if obj fits, or a wrapper (_OptionFillable, _UnionFillable)
+# that takes ownership of self if it doesn't.  Nothing that has been filled is ever refilled.
+
+class _Options(object):
+    __slots__ = ["chunksize", "maskmissing", "strict"]
+
+    def __init__(self, chunksize, maskmissing, strict=False):
+        self.chunksize = chunksize
+        self.maskmissing = maskmissing
+        self.strict = strict    # if True, objects that do not fit are errors rather than new union types (None is always allowed)
+
+def _mismatch(obj):
+    return TypeError("{0} does not match the declared type".format(repr(obj)))
+
+class _Fillable(object):
+    def fill(self, obj):
+        if obj is None:
+            return _OptionFillable(self.options, self).fill(obj)
+        elif self.accepts(obj):
+            self._fill(obj)
+            return self
+        else:
+            if self.options.strict:
+                raise _mismatch(obj)
+            return _UnionFillable(self.options, self).fill(obj)
 
-                def newchunk(obj):
-                    out = JaggedArray.fromoffsets(numpy.zeros(chunksize + 1, dtype=awkward.array.base.AwkwardArray.INDEXTYPE), PartitionedArray([0], []))
-                    out._starts[0] = 0
-                    out._content._offsets = [0]  # as an appendable list, not a Numpy array
-                    return out
+class _UnknownFillable(_Fillable):
+    # nothing but None seen so far
+    def __init__(self, options, nulls=0):
+        self.options = options
+        self.nulls = nulls
 
-                def ismine(obj, x):
-                    return isinstance(x, JaggedArray)
+    def __len__(self):
+        return self.nulls
 
-                def promote(obj, x):
-                    return x
+    def accepts(self, obj):
+        return obj is None
 
-                def fillobj(obj, array, where):
-                    array._stops[where] = array._starts[where]
-                    for x in it:
-                        fill(x, array._content._chunks, array._content._offsets)
-                        array._stops[where] += 1
+    def fill(self, obj):
+        if obj is None:
+            self.nulls += 1
+            return self
+        out = _fillablefor(obj, self.options)
+        if self.nulls > 0:
+            out = _OptionFillable(self.options, out, self.nulls)
+        return out.fill(obj)
+
+    def snapshot(self):
+        if self.nulls == 0:
+            return awkward.util.numpy.empty(0, dtype=awkward.util.DEFAULTTYPE)
+        else:
+            return MaskedArray(awkward.util.numpy.ones(self.nulls, dtype=awkward.util.MASKTYPE), awkward.util.numpy.zeros(self.nulls, dtype=awkward.util.DEFAULTTYPE), maskedwhen=True)
 
-                insert(obj, chunks, offsets, newchunk, ismine, promote, fillobj)
+    def clear(self):
+        self.nulls = 0
 
-    def trim(length, array):
-        if isinstance(array, numpy.ndarray):
-            if len(array) == length:
-                return array                          # the length is right: don't copy it
-            else:
-                return numpy.array(array[:length])    # copy so that the base can be deleted
+class _BoolFillable(_Fillable):
+    def __init__(self, options):
+        self.options = options
+        self.buffer = _Buffer(awkward.util.BOOLTYPE, options.chunksize)
 
-        elif isinstance(array, PartitionedArray):
-            for i in range(len(array._chunks)):
-                array._chunks[i] = trim(array._offsets[i + 1] - array._offsets[i], array._chunks[i])
-            return array
+    def __len__(self):
+        return self.buffer.length
 
-        elif isinstance(array, IndexedMaskedArray):
-            index = trim(length, array._index)
-            selection = (index != array._maskedwhen)
-            content = trim(index[selection][-1] + 1, array._content)
+    def accepts(self, obj):
+        return _kind(obj) == _BOOL
 
-            if isinstance(content, numpy.ndarray):
-                # for simple types, IndexedMaskedArray wastes space; convert to an Arrow-like BitMaskedArray
-                mask = numpy.zeros(length, dtype=awkward.array.base.AwkwardArray.MASKTYPE)
-                mask[selection] = True
+    def _fill(self, obj):
+        self.buffer.append(obj)
 
-                newcontent = numpy.empty(length, dtype=content.dtype)
-                newcontent[selection] = content
+    def snapshot(self):
+        return self.buffer.snapshot()
 
-                return BitMaskedArray.fromboolmask(mask, newcontent, maskedwhen=False, lsb=True)
+    def clear(self):
+        self.buffer = _Buffer(awkward.util.BOOLTYPE, self.options.chunksize)
 
+class _NumberFillable(_Fillable):
+    # int64 -> float64 -> complex128; the buffer is converted once per promotion, not once per object
+    def __init__(self, options, dtype=None):
+        self.options = options
+        self.limits = None
+        if dtype is None:
+            self.level = 0
+            self.buffer = _Buffer(_numberdtypes[0], options.chunksize)
+        else:
+            # a declared dtype is never promoted; numbers of a higher level or out of its range are mismatches
+            if issubclass(dtype.type, awkward.util.numpy.integer):
+                self.level = 0
+                info = awkward.util.numpy.iinfo(dtype)
+                self.limits = (int(info.min), int(info.max))
+            elif issubclass(dtype.type, awkward.util.numpy.floating):
+                self.level = 1
+                info = awkward.util.numpy.finfo(dtype)
+                self.limits = (float(info.min), float(info.max))
             else:
-                # for complex types, IndexedMaskedArray saves space; keep it
-                return IndexedMaskedArray(index, content)
-
-        elif isinstance(array, UnionArray):
-            tags = trim(length, array._tags)
-            index = trim(length, array._index)
-
-            contents = []
-            for tag, content in enumerate(array._contents):
-                length = index[tags == tag][-1] + 1
-                contents.append(trim(length, content))
-
-            return UnionArray(tags, index, contents)
+                self.level = 2
+            self.buffer = _Buffer(dtype, options.chunksize)
+
+    def __len__(self):
+        return self.buffer.length
+
+    def accepts(self, obj):
+        return _numberlevel(obj) is not None
+
+    def _fill(self, obj):
+        level = _numberlevel(obj)
+        if level > self.level:
+            if self.options.strict:
+                raise _mismatch(obj)
+            self.level = level
+            self.buffer.astype(_numberdtypes[level])
+        if self.limits is not None and (obj < self.limits[0] or obj > self.limits[1]) and not (level == 1 and math.isinf(obj)):
+            raise _mismatch(obj)
+        self.buffer.append(obj)
+
+    def fill(self, obj):
+        if _numberlevel(obj) is None:
+            return super(_NumberFillable, self).fill(obj)
+        self._fill(obj)
+        return self
+
+    def _extend(self, array):
+        if issubclass(array.dtype.type, awkward.util.numpy.complexfloating):
+            level = 2
+        elif issubclass(array.dtype.type, awkward.util.numpy.integer):
+            level = 0
+        else:
+            level = 1
+        if level > self.level:
+            if self.options.strict:
+                raise _mismatch(array)
+            self.level = level
+            self.buffer.astype(_numberdtypes[level])
+        if self.limits is not None and not awkward.util.numpy.can_cast(array.dtype, self.buffer.data.dtype):
+            finite = array[awkward.util.numpy.isfinite(array)]
+            if (finite < self.limits[0]).any() or (finite > self.limits[1]).any():
+                raise _mismatch(array)
+        self.buffer.extend(array)
+
+    def snapshot(self):
+        return self.buffer.snapshot()
+
+    def clear(self):
+        self.buffer = _Buffer(self.buffer.data.dtype, self.options.chunksize)
+
+class _StringFillable(_Fillable):
+    # encoding None for bytes, "utf-8" for str
+    def __init__(self, options, encoding):
+        self.options = options
+        self.encoding = encoding
+        self.offsets = _Buffer(awkward.util.INDEXTYPE, options.chunksize + 1)
+        self.offsets.append(0)
+        self.content = bytearray()
+
+    def __len__(self):
+        return self.offsets.length - 1
+
+    def accepts(self, obj):
+        return _kind(obj) == (_BYTES if self.encoding is None else _STRING)
+
+    def _fill(self, obj):
+        if self.encoding is not None:
+            obj = obj.encode(self.encoding)
+        self.content.extend(obj)
+        self.offsets.append(len(self.content))
+
+    def snapshot(self):
+        content = awkward.util.numpy.frombuffer(bytes(self.content), dtype=awkward.util.CHARTYPE)
+        return StringArray.fromoffsets(self.offsets.snapshot(), content, encoding=self.encoding)
+
+    def clear(self):
+        self.offsets = _Buffer(awkward.util.INDEXTYPE, self.options.chunksize + 1)
+        self.offsets.append(0)
+        self.content = bytearray()
+
+class _JaggedFillable(_Fillable):
+    def __init__(self, options):
+        self.options = options
+        self.offsets = _Buffer(awkward.util.INDEXTYPE, options.chunksize + 1)
+        self.offsets.append(0)
+        self.content = _UnknownFillable(options)
+
+    def __len__(self):
+        return self.offsets.length - 1
+
+    def accepts(self, obj):
+        return _kind(obj) == _LIST
+
+    def _fill(self, obj):
+        content = self.content
+        if isinstance(obj, awkward.util.numpy.ndarray) and len(obj.shape) == 1 and issubclass(obj.dtype.type, awkward.util.numpy.number) and (isinstance(content, _NumberFillable) or (isinstance(content, _UnknownFillable) and len(content) == 0)):
+            # one-dimensional numerical arrays are copied in bulk
+            if isinstance(content, _UnknownFillable):
+                content = _NumberFillable(self.options)
+            content._extend(obj)
+        else:
+            for x in obj:
+                content = content.fill(x)
+        self.content = content
+        self.offsets.append(len(content))
+
+    def snapshot(self):
+        return JaggedArray.fromoffsets(self.offsets.snapshot(), self.content.snapshot())
+
+    def clear(self):
+        self.offsets = _Buffer(awkward.util.INDEXTYPE, self.options.chunksize + 1)
+        self.offsets.append(0)
+        self.content.clear()
+
+class _TableFillable(_Fillable):
+    # a field that is missing from some records is filled with None, making it an option type
+    def __init__(self, options):
+        self.options = options
+        self.fields = awkward.util.OrderedDict()
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def accepts(self, obj):
+        if _kind(obj) != _DICT:
+            return False
+        elif self.options.maskmissing or self.length == 0:
+            return True
+        else:
+            return len(obj) == len(self.fields) and all(n in self.fields for n in obj)
+
+    def _fill(self, obj):
+        fields = self.fields
+        for n, x in obj.items():
+            field = fields.get(n, None)
+            if field is None:
+                if self.options.strict:
+                    raise TypeError("field {0} is not in the declared type".format(repr(n)))
+                field = _UnknownFillable(self.options, self.length)
+            fields[n] = field.fill(x)
+
+        if len(fields) != len(obj):
+            for n, field in fields.items():
+                if n not in obj:
+                    fields[n] = field.fill(None)
+
+        self.length += 1
+
+    def snapshot(self):
+        out = Table()
+        for n, x in self.fields.items():
+            out[n] = x.snapshot()
+        if len(self.fields) == 0:
+            out = Table.fromview((0, 1, self.length), out)
+        return out
+
+    def clear(self):
+        for x in self.fields.values():
+            x.clear()
+        self.length = 0
+
+class _TupleFillable(_Fillable):
+    # tuples become Tables with columns "0", "1", "2", ...
+    def __init__(self, options, width):
+        self.options = options
+        self.fields = [_UnknownFillable(options) for i in range(width)]
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def accepts(self, obj):
+        return _kind(obj) == _TUPLE and len(obj) == len(self.fields)
+
+    def _fill(self, obj):
+        fields = self.fields
+        for i, x in enumerate(obj):
+            fields[i] = fields[i].fill(x)
+        self.length += 1
+
+    def snapshot(self):
+        out = Table()
+        for i, x in enumerate(self.fields):
+            out[str(i)] = x.snapshot()
+        if len(self.fields) == 0:
+            out = Table.fromview((0, 1, self.length), out)
+        return out
+
+    def clear(self):
+        for x in self.fields:
+            x.clear()
+        self.length = 0
+
+class _OptionFillable(_Fillable):
+    # index is -1 for None and the position in content otherwise
+    def __init__(self, options, content, nulls=0):
+        self.options = options
+        self.content = content
+        self.index = _Buffer(awkward.util.INDEXTYPE, max(options.chunksize, len(content) + nulls))
+        self.index.extend(awkward.util.numpy.arange(len(content), dtype=awkward.util.INDEXTYPE))
+        self.index.extend(awkward.util.numpy.full(nulls, -1, dtype=awkward.util.INDEXTYPE))
+
+    def __len__(self):
+        return self.index.length
+
+    def accepts(self, obj):
+        return obj is None or self.content.accepts(obj)
+
+    def fill(self, obj):
+        if obj is None:
+            self.index.append(-1)
+        else:
+            self.index.append(len(self.content))
+            self.content = self.content.fill(obj)
+        return self
+
+    def snapshot(self):
+        index = self.index.snapshot()
+        content = self.content.snapshot()
+        if isinstance(content, awkward.util.numpy.ndarray):
+            # flat data are spread out to full length behind a bitmask, as in Arrow
+            mask = (index < 0)
+            dense = awkward.util.numpy.zeros(len(index), dtype=content.dtype)
+            dense[~mask] = content
+            return BitMaskedArray.fromboolmask(mask, dense, maskedwhen=True, lsborder=True)
+        else:
+            return IndexedMaskedArray(index, content)
+
+    def clear(self):
+        self.index = _Buffer(awkward.util.INDEXTYPE, self.options.chunksize)
+        self.content.clear()
+
+class _UnionFillable(_Fillable):
+    def __init__(self, options, first):
+        self.options = options
+        self.contents = [first]
+        self.tags = _Buffer(awkward.util.TAGTYPE, max(options.chunksize, len(first)))
+        self.tags.extend(awkward.util.numpy.zeros(len(first), dtype=awkward.util.TAGTYPE))
+        self.index = _Buffer(awkward.util.INDEXTYPE, max(options.chunksize, len(first)))
+        self.index.extend(awkward.util.numpy.arange(len(first), dtype=awkward.util.INDEXTYPE))
+
+    def __len__(self):
+        return self.tags.length
+
+    def accepts(self, obj):
+        return any(x.accepts(obj) for x in self.contents)
+
+    def _fill(self, obj):
+        for tag, content in enumerate(self.contents):
+            if content.accepts(obj):
+                break
+        else:
+            if self.options.strict:
+                raise _mismatch(obj)
+            tag = len(self.contents)
+            if tag >= 256:
+                raise ValueError("too many distinct types to fit in a UnionArray")
+            self.contents.append(_fillablefor(obj, self.options))
+
+        self.tags.append(tag)
+        self.index.append(len(self.contents[tag]))
+        self.contents[tag] = self.contents[tag].fill(obj)
+
+    def fill(self, obj):
+        if obj is None:
+            return _OptionFillable(self.options, self).fill(obj)
+        self._fill(obj)
+        return self
 
-        elif isinstance(array, JaggedArray):
-            offsets = array.offsets                   # fill creates aliased starts/stops
-            if len(offsets) != length + 1:
-                offsets = numpy.array(offsets[: length + 1])
+    def snapshot(self):
+        return UnionArray(self.tags.snapshot(), self.index.snapshot(), [x.snapshot() for x in self.contents])
 
-            return JaggedArray.fromoffsets(offsets, trim(offsets[-1], array._content))
+    def clear(self):
+        self.tags = _Buffer(awkward.util.TAGTYPE, self.options.chunksize)
+        self.index = _Buffer(awkward.util.INDEXTYPE, self.options.chunksize)
+        for x in self.contents:
+            x.clear()
 
-        elif isinstance(array, NamedTable):
-            return NamedTable(length, array._name, collections.OrderedDict((n, trim(length, x)) for n, x in array._content.items()))
+################################################################ fromiter
 
-        elif isinstance(array, Table):
-            return Table(length, collections.OrderedDict((n, trim(length, x)) for n, x in array._content.items()))
+def fromiter(iterable, chunksize=1024, maskmissing=True, references=False):
+    if references:
+        raise NotImplementedError    # keep all ids in a hashtable to create pointers (IndexedArray)
 
-        elif isinstance(array, ObjectArray):
-            return ObjectArray(array._generator, trim(length, array._content))
+    fillable = _UnknownFillable(_Options(chunksize, maskmissing))
+    for obj in iterable:
+        fillable = fillable.fill(obj)
+    return fillable.snapshot()
 
-        else:
-            raise AssertionError(array)
+def fromiterchunks(iterable, chunksize=1024, maskmissing=True):
+    # the type inferred so far is carried from one chunk to the next, but not the data
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
 
-    chunks = []
-    offsets = [0]
+    fillable = _UnknownFillable(_Options(chunksize, maskmissing))
     length = 0
-    for x in iterable:
-        fill(x, chunks, offsets)
+    for obj in iterable:
+        fillable = fillable.fill(obj)
         length += 1
-        
-    return trim(length, PartitionedArray(offsets, chunks))
+        if length == chunksize:
+            yield fillable.snapshot()
+            fillable.clear()
+            length = 0
+
+    if length > 0:
+        yield fillable.snapshot()
+
+################################################################ fromjson
+
+def _jsonblocks(source, blocksize):
+    if isinstance(source, awkward.util.string) and not isinstance(source, bytes):
+        with open(source, "rb") as file:
+            for block in _jsonblocks(file, blocksize):
+                yield block
+
+    elif hasattr(source, "read"):
+        while True:
+            block = source.read(blocksize)
+            if len(block) == 0:
+                break
+            yield block
+
+    else:
+        # bytes, bytearray, mmap, or anything else with the buffer protocol
+        source = memoryview(source)
+        for start in range(0, len(source), blocksize):
+            yield source[start : start + blocksize].tobytes()
+
+def _jsonrecords(source, blocksize):
+    # yields (line number, record); only whole lines are decoded, so a multibyte character is never split between blocks
+    loads = json.JSONDecoder().decode
+    tail = b""
+    lineno = 0
+    for block in _jsonblocks(source, blocksize):
+        end = block.rfind(b"\n")
+        if end < 0:
+            tail += block
+            continue
+        lines = (tail + block[:end]).decode("utf-8").split("\n")
+        tail = block[end + 1:]
+        for line in lines:
+            lineno += 1
+            if len(line) != 0 and not line.isspace():
+                yield lineno, loads(line)
+
+    if len(tail) != 0 and not tail.isspace():
+        yield lineno + 1, loads(tail.decode("utf-8"))
+
+def fromjson(source, type=None, chunksize=1024, maskmissing=True, blocksize=1048576):
+    # one record per line; source is a filename, a binary file object, or bytes-like data (such as an mmap)
+    # a declared type's outermost dimension is ignored; types do not record masking, so null is accepted anywhere
+    if type is None:
+        fillable = _UnknownFillable(_Options(chunksize, maskmissing))
+    elif isinstance(type, awkward.type.ArrayType):
+        fillable = _fillablefortype(type.to, _Options(chunksize, maskmissing, strict=True))
+    else:
+        raise TypeError("type must be an awkward.type.ArrayType")
+
+    for lineno, obj in _jsonrecords(source, blocksize):
+        try:
+            fillable = fillable.fill(obj)
+        except TypeError as err:
+            raise TypeError("line {0}: {1}".format(lineno, str(err)))
+    return fillable.snapshot()
@@ -142,7 +142,7 @@ def isstringslice(where):
         return False
     elif isinstance(where, (numpy.ndarray, awkward.array.base.AwkwardArray)) and issubclass(where.dtype.type, (numpy.str, numpy.str_)):
         return True
-    elif isinstance(where, (numpy.ndarray, awkward.array.base.AwkwardArray)) and issubclass(where.dtype.type, (numpy.object, numpy.object_)) and not issubclass(where.dtype.type, (numpy.bool, numpy.bool_)):
+    elif isinstance(where, (numpy.ndarray, awkward.array.base.AwkwardArray)) and issubclass(where.dtype.type, numpy.object_):
         return all(isinstance(x, string) for x in where)
     elif isinstance(where, (numpy.ndarray, awkward.array.base.AwkwardArray)):
         return False
@@ -54,6 +54,18 @@ class Test(unittest.TestCase):
             a = pyarrow.array([True, True, False, False, True])
             assert awkward.arrow.view(a).tolist() == [True, True, False, False, True]
 
+    def test_arrow_boolean_null(self):
+        if pyarrow is not None:
+            a = pyarrow.array([True, None, False, True, False, False, True, True, True, None])
+            b = awkward.arrow.view(a)
+            assert not b.content.ismaterialized
+            assert b.tolist() == [True, None, False, True, False, False, True, True, True, None]
+
+    def test_arrow_nested_boolean(self):
+        if pyarrow is not None:
+            a = pyarrow.array([[True, False], [], [None, True, True]])
+            assert awkward.arrow.view(a).tolist() == [[True, False], [], [None, True, True]]
+
     def test_arrow_array_null(self):
         if pyarrow is not None:
             a = pyarrow.array([1.1, 2.2, 3.3, None, 4.4, 5.5])
@@ -159,6 +171,25 @@ class Test(unittest.TestCase):
             a = pyarrow.array(["one", "two", None, u"fo\u2014ur", "five"])
             assert awkward.arrow.view(a).tolist() == ["one", "two", None, u"fo\u2014ur", "five"]
 
+    def test_arrow_strings_offsets32(self):
+        if pyarrow is not None:
+            a = awkward.arrow.view(pyarrow.array(["one", "two", "three"]))
+            if isinstance(a, MaskedArray):
+                a = a.content
+            assert a.starts.dtype == numpy.dtype(numpy.int32)
+            assert a._content._tojagged(copy=False).starts.dtype == numpy.dtype(numpy.int32)
+            assert (a == a).tolist() == [True, True, True]
+
+    def test_arrow_large_strings(self):
+        if pyarrow is not None and hasattr(pyarrow, "large_string"):
+            a = pyarrow.array(["one", "two", None, u"fo\u2014ur"], type=pyarrow.large_string())
+            assert awkward.arrow.view(a).tolist() == ["one", "two", None, u"fo\u2014ur"]
+
+    def test_arrow_large_list(self):
+        if pyarrow is not None and hasattr(pyarrow, "large_list"):
+            a = pyarrow.array([[1.1, 2.2, 3.3], [], [4.4, 5.5]], type=pyarrow.large_list(pyarrow.float64()))
+            assert awkward.arrow.view(a).tolist() == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+
     def test_arrow_binary(self):
         if pyarrow is not None:
             a = pyarrow.array([b"one", b"two", b"three", b"four", b"five"])
@@ -247,3 +247,39 @@ class Test(unittest.TestCase):
         assert [a[i] for i in range(len(a))] == [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9]
         assert len(a.chunks) == 4
         assert a.offsets.tolist() == [0, 3, 6, 9, 10]
+
+    def test_appendable_snapshot(self):
+        a = AppendableArray(3, numpy.float64)
+        assert a.snapshot().tolist() == []
+        a.extend([0.0, 1.1])
+        first = a.snapshot()
+        assert isinstance(first, numpy.ndarray)
+        assert first.tolist() == [0.0, 1.1]
+        a.extend([2.2, 3.3])
+        assert first.tolist() == [0.0, 1.1]
+        assert isinstance(a.snapshot(), ChunkedArray)
+        assert a.snapshot().tolist() == [0.0, 1.1, 2.2, 3.3]
+        assert a.snapshot().chunks[0].base is a.chunks[0]
+
+    def test_appendable_jagged(self):
+        a = AppendableJaggedArray(numpy.int64, capacity=1)
+        a.append([1, 2, 3])
+        a.append([])
+        first = a.snapshot()
+        a.extend([[4, 5], [6]])
+        a.extend(JaggedArray.fromcounts([1, 0, 2], [7, 8, 9]))
+        assert len(a) == 7
+        assert first.tolist() == [[1, 2, 3], []]
+        assert a.snapshot().tolist() == [[1, 2, 3], [], [4, 5], [6], [7], [], [8, 9]]
+        assert a.snapshot().content.dtype == numpy.dtype(numpy.int64)
+
+    def test_appendable_table(self):
+        a = AppendableTable([("x", numpy.int32), ("y", numpy.float64)], capacity=1)
+        a.append({"x": 1, "y": 1.1})
+        a.append((2, 2.2))
+        first = a.snapshot()
+        a.extend(Table(x=numpy.array([3, 4]), y=numpy.array([3.3, 4.4])))
+        a.extend([{"x": 5, "y": 5.5}])
+        assert first.tolist() == [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]
+        assert a.snapshot().tolist() == [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}, {"x": 3, "y": 3.3}, {"x": 4, "y": 4.4}, {"x": 5, "y": 5.5}]
+        assert a.snapshot()["x"].dtype == numpy.dtype(numpy.int32)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2018, DIANA-HEP
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# 
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# 
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+import numpy
+
+from awkward import *
+
+class Test(unittest.TestCase):
+    def runTest(self):
+        pass
+
+    def test_generate_numbers(self):
+        a = fromiter([1, 2, 3])
+        self.assertEqual(a.dtype, numpy.dtype(numpy.int64))
+        self.assertEqual(a.tolist(), [1, 2, 3])
+        a = fromiter([1, 2.5, 3])
+        self.assertEqual(a.dtype, numpy.dtype(numpy.float64))
+        self.assertEqual(a.tolist(), [1.0, 2.5, 3.0])
+        self.assertEqual(fromiter([1, 2j]).tolist(), [1, 2j])
+        self.assertEqual(fromiter([True, False]).dtype, numpy.dtype(numpy.bool_))
+        self.assertEqual(fromiter([]).tolist(), [])
+
+    def test_generate_growth(self):
+        a = fromiter(range(1000), chunksize=1)
+        self.assertEqual(a.tolist(), list(range(1000)))
+        a = fromiter([[i] * (i % 3) for i in range(100)], chunksize=1)
+        self.assertEqual(a.tolist(), [[i] * (i % 3) for i in range(100)])
+
+    def test_generate_masked(self):
+        a = fromiter([1, None, 3])
+        self.assertTrue(isinstance(a, BitMaskedArray))
+        self.assertEqual(a.tolist(), [1, None, 3])
+        self.assertEqual(fromiter([None, None, 3.5]).tolist(), [None, None, 3.5])
+        self.assertEqual(fromiter([None, None]).tolist(), [None, None])
+        a = fromiter(["one", None, "three"])
+        self.assertTrue(isinstance(a, IndexedMaskedArray))
+        self.assertEqual(a.tolist(), ["one", None, "three"])
+
+    def test_generate_jagged(self):
+        a = fromiter([[1, 2, 3], [], [4, 5]])
+        self.assertTrue(isinstance(a, JaggedArray))
+        self.assertEqual(a.tolist(), [[1, 2, 3], [], [4, 5]])
+        self.assertEqual(fromiter([[[1], []], [], [[2, 3]]]).tolist(), [[[1], []], [], [[2, 3]]])
+        self.assertEqual(fromiter([numpy.array([1, 2]), numpy.array([3.5])]).tolist(), [[1.0, 2.0], [3.5]])
+        self.assertEqual(fromiter([[1, None], [2.5]]).tolist(), [[1.0, None], [2.5]])
+
+    def test_generate_strings(self):
+        a = fromiter(["one", "two", "", "thé"])
+        self.assertTrue(isinstance(a, StringArray))
+        self.assertEqual(a.tolist(), ["one", "two", "", "thé"])
+        self.assertEqual(fromiter([b"one", b"two"]).tolist(), [b"one", b"two"])
+
+    def test_generate_table(self):
+        a = fromiter([{"x": 1, "y": "one"}, {"x": 2, "y": "two"}])
+        self.assertTrue(isinstance(a, Table))
+        self.assertEqual(a.tolist(), [{"x": 1, "y": "one"}, {"x": 2, "y": "two"}])
+        a = fromiter([{"x": 1}, {"y": 2.2}, {"x": 3, "y": 3.3}])
+        self.assertEqual(a.tolist(), [{"x": 1, "y": None}, {"x": None, "y": 2.2}, {"x": 3, "y": 3.3}])
+        a = fromiter([(1, "one"), (2, "two")])
+        self.assertEqual(a["0"].tolist(), [1, 2])
+        self.assertEqual(a["1"].tolist(), ["one", "two"])
+        self.assertEqual(len(fromiter([{}, {}, {}])), 3)
+
+    def test_generate_union(self):
+        a = fromiter([1, "two", [3], 4.5])
+        self.assertTrue(isinstance(a, UnionArray))
+        self.assertEqual(a.tags.tolist(), [0, 1, 2, 0])
+        self.assertEqual(a.tolist(), [1.0, "two", [3], 4.5])
+        self.assertEqual(fromiter([1, "two", None]).tolist(), [1, "two", None])
+        a = fromiter([{"x": 1}, {"y": 2}], maskmissing=False)
+        self.assertTrue(isinstance(a, UnionArray))
+        self.assertEqual(a.tolist(), [{"x": 1}, {"y": 2}])
+
+    def test_generate_fromiter_bigint(self):
+        a = fromiter([1, 2**64, 3])
+        self.assertEqual(a.dtype, numpy.dtype(numpy.float64))
+        self.assertEqual(a.tolist(), [1.0, float(2**64), 3.0])
+        self.assertEqual(fromiter([-2**63, 2**63 - 1]).dtype, numpy.dtype(numpy.int64))
+        self.assertEqual(fromiter([numpy.uint64(2**63)]).dtype, numpy.dtype(numpy.float64))
+        import awkward.type
+        self.assertRaises(TypeError, lambda: fromjson(b"1\n" + str(2**70).encode() + b"\n", type=awkward.type.ArrayType(0, numpy.int64)))
+
+    def test_generate_fromjson(self):
+        data = b'{"x": 1, "y": [1.1, 2.2], "z": "one"}\n\n{"x": 2, "y": [], "z": null}\n{"x": 3, "y": [3.3], "z": "thr\xc3\xa9\xc3\xa9"}'
+        expect = [{"x": 1, "y": [1.1, 2.2], "z": "one"}, {"x": 2, "y": [], "z": None}, {"x": 3, "y": [3.3], "z": u"thr\xe9\xe9"}]
+        self.assertEqual(fromjson(data).tolist(), expect)
+        for blocksize in 1, 2, 7, 100:
+            self.assertEqual(fromjson(data, blocksize=blocksize).tolist(), expect)
+        self.assertEqual(fromjson(b"[1, 2]\n[]\n").tolist(), [[1, 2], []])
+        self.assertEqual(fromjson(b"").tolist(), [])
+
+    def test_generate_fromjson_type(self):
+        import awkward.type
+        tpe = awkward.type.ArrayType("x", numpy.float32) & awkward.type.ArrayType("y", numpy.inf, numpy.int32)
+        a = fromjson(b'{"x": 1, "y": [1, 2]}\n{"x": 2, "y": []}', type=awkward.type.ArrayType(0, tpe))
+        self.assertEqual(a["x"].dtype, numpy.dtype(numpy.float32))
+        self.assertEqual(a["y"].content.dtype, numpy.dtype(numpy.int32))
+        self.assertEqual(a.tolist(), [{"x": 1.0, "y": [1, 2]}, {"x": 2.0, "y": []}])
+        self.assertRaises(TypeError, lambda: fromjson(b'{"x": 1, "y": [1, 2]}\n{"x": 2, "y": [2.5]}', type=awkward.type.ArrayType(0, tpe)))
+        self.assertRaises(TypeError, lambda: fromjson(b'{"x": 1, "y": [], "z": 3}', type=awkward.type.ArrayType(0, tpe)))
+        try:
+            fromjson(b'"one"\n\n{"x": 1}\n', type=awkward.type.ArrayType(0, str))
+        except TypeError as err:
+            self.assertTrue(str(err).startswith("line 3:"))
+        else:
+            self.fail("record of the wrong type was accepted")
+        self.assertEqual(fromjson(b"1\nnull\n", type=awkward.type.ArrayType(0, awkward.type.OptionType(numpy.dtype(numpy.float32)))).tolist(), [1.0, None])
+        data = [{"x": 1, "y": [1.1, None]}, None, {"x": None, "y": []}]
+        b = fromjson(b'{"x": 1, "y": [1.1, null]}\nnull\n{"x": null, "y": []}', type=awkward.type.fromarray(fromiter(data)))
+        self.assertEqual(b.tolist(), data)
+        self.assertEqual(fromjson(b"1\nnull\n3\n", type=awkward.type.fromarray(fromiter([1, None, 3]))).tolist(), [1, None, 3])
+        self.assertRaises(TypeError, lambda: fromjson(b"1\n300\n", type=awkward.type.ArrayType(numpy.inf, numpy.dtype(numpy.int8))))
+        self.assertRaises(TypeError, lambda: fromjson(b"1\n-1\n", type=awkward.type.ArrayType(numpy.inf, numpy.dtype(numpy.uint8))))
+        self.assertEqual(fromjson(b"-128\n127\n", type=awkward.type.ArrayType(numpy.inf, numpy.dtype(numpy.int8))).tolist(), [-128, 127])
+
+    def test_generate_fromiterchunks(self):
+        data = [{"x": i, "y": [i] * (i % 3), "z": str(i)} for i in range(10)]
+        chunks = list(fromiterchunks(data, chunksize=4))
+        self.assertEqual([len(x) for x in chunks], [4, 4, 2])
+        self.assertEqual(sum((x.tolist() for x in chunks), []), data)
+        self.assertEqual(ChunkedArray(list(fromiterchunks(range(10), chunksize=3))).tolist(), list(range(10)))
+        self.assertEqual([x.tolist() for x in fromiterchunks([1, "two", None, 4.5, "five"], chunksize=2)], [[1, "two"], [None, 4.5], ["five"]])
+        self.assertEqual(list(fromiterchunks([], chunksize=2)), [])
@@ -262,3 +262,111 @@ class Test(unittest.TestCase):
     def test_indexed_ufunc(self):
         a = SparseArray(10, [1, 3, 5, 7, 9], [100, 101, 102, 103, 104])
         assert (a + 100).tolist() == [100, 200, 100, 201, 100, 202, 100, 203, 100, 204]
+
+    def test_sparse_ufunc(self):
+        a = SparseArray(10, [1, 3, 5, 7, 9], [100, 101, 102, 103, 104])
+        b = SparseArray(10, [2, 3, 5, 8], [1, 2, 3, 4])
+        assert isinstance(a + b, SparseArray)
+        assert (a + b).tolist() == (a.dense + b.dense).tolist()
+        assert (a + b).index.tolist() == [1, 2, 3, 5, 7, 8, 9]
+        assert (a * b).tolist() == (a.dense * b.dense).tolist()
+        assert (a * b).index.tolist() == [3, 5]
+        assert (a + 100).tolist() == [100, 200, 100, 201, 100, 202, 100, 203, 100, 204]
+        assert (a + numpy.arange(10)).tolist() == (a.dense + numpy.arange(10)).tolist()
+
+    def test_sparse_dense_jagged(self):
+        a = SparseArray(6, [1, 4], JaggedArray.fromiter([[1, 2], [3]]))
+        assert a.tolist() == [[], [1, 2], [], [], [3], []]
+        assert a.dense.tolist() == [[], [1, 2], [], [], [3], []]
+        assert [x.tolist() for x in a] == [[], [1, 2], [], [], [3], []]
+
+    def test_sparse_dense_table(self):
+        a = SparseArray(4, [2], Table(x=[1.5], y=[7]))
+        assert a.tolist() == [{"x": 0.0, "y": 0}, {"x": 0.0, "y": 0}, {"x": 1.5, "y": 7}, {"x": 0.0, "y": 0}]
+        assert a.dense.tolist() == [{"x": 0.0, "y": 0}, {"x": 0.0, "y": 0}, {"x": 1.5, "y": 7}, {"x": 0.0, "y": 0}]
+
+    def test_sparse_reduce(self):
+        a = SparseArray(10, [1, 3, 5, 7, 9], [100.0, 101.0, 102.0, 103.0, 104.0])
+        assert a.sum() == 510.0
+        assert a.mean() == 51.0
+        assert a.count_nonzero() == 5
+        assert a.min() == 0.0
+        assert a.max() == 104.0
+        assert a.any() and not a.all()
+        b = SparseArray(3, [0, 1, 2], [5, 6, 7])
+        assert b.min() == 5 and b.all()
+
+    def test_sparse_fromchunked(self):
+        a = ChunkedArray([SparseArray(5, [1, 3], [1.1, 2.2]), SparseArray(4, [0], [3.3])])
+        b = SparseArray.fromchunked(a)
+        assert b.index.tolist() == [1, 3, 5]
+        assert b.tolist() == [0.0, 1.1, 0.0, 2.2, 0.0, 3.3, 0.0, 0.0, 0.0]
+
+    def test_sparse_fromcoo(self):
+        a = SparseArray.fromcoo(10, [7, 2, 7, 5, 2, 0], [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        assert a.index.tolist() == [0, 2, 5, 7]
+        assert a.tolist() == [6.0, 0.0, 7.0, 0.0, 0.0, 4.0, 0.0, 4.0, 0.0, 0.0]
+        assert SparseArray.fromcoo(10, [7, 2, 7], [1, 2, 3], reduce=numpy.maximum).tolist() == [0, 0, 2, 0, 0, 0, 0, 3, 0, 0]
+
+    def test_sparse_merge(self):
+        a = SparseArray(10, [0, 2, 5, 7], [6.0, 7.0, 4.0, 4.0])
+        b = a.merge([1, 2, 9, 9], [10.0, 20.0, 30.0, 40.0])
+        assert b.index.tolist() == [0, 1, 2, 5, 7, 9]
+        assert b.content.tolist() == [6.0, 10.0, 27.0, 4.0, 4.0, 70.0]
+
+    def test_indexed_compose(self):
+        a = IndexedArray([6, 5, 4, 3, 2, 1, 0], IndexedArray([3, 2, 4, 2, 2, 4, 0], [0.0, 1.1, 2.2, 3.3, 4.4]))
+        b = a[[0, 2, 4]]
+        assert isinstance(b, IndexedArray) and not isinstance(b.content, IndexedArray)
+        assert b.index.tolist() == [0, 2, 4]
+        assert b.tolist() == [0.0, 2.2, 4.4]
+        assert b[[2, 2]].index.tolist() == [4, 4]
+        assert a.compact().tolist() == [0.0, 4.4, 2.2, 2.2, 4.4, 2.2, 3.3]
+        class Sub(IndexedArray):
+            pass
+        c = Sub([1, 0], IndexedArray([2, 1, 0], [0.0, 1.1, 2.2]))[[1, 1]]
+        assert type(c) is Sub and not isinstance(c.content, IndexedArray)
+        assert c.tolist() == [2.2, 2.2]
+
+    def test_byteindexed_compose(self):
+        a = ByteIndexedArray([12, 8, 4, 0], b"\x00\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00", numpy.int32)
+        b = a[[3, 1]]
+        assert isinstance(b, ByteIndexedArray)
+        assert b.index.tolist() == [0, 8]
+        assert b.compact().tolist() == [0, 2]
+
+    def test_indexed_table_inverse(self):
+        a = IndexedArray([3, 2, 4, 0, 1], Table(a=[0.0, 1.1, 2.2, 3.3, 4.4]))
+        a["b"] = numpy.array([10, 20, 30, 40, 50])
+        inverse = a._inverse
+        a["c"] = numpy.array([1, 2, 3, 4, 5])
+        assert a._inverse is inverse
+        assert a["b"].tolist() == [10, 20, 30, 40, 50]
+        assert a["c"].tolist() == [1, 2, 3, 4, 5]
+        assert a.content["b"].tolist() == [40, 50, 20, 10, 30]
+        self.assertRaises(ValueError, lambda: IndexedArray([0, 0], Table(a=[0.0, 1.1])).__setitem__("b", numpy.array([1, 2])))
+
+    def test_indexed_dictionary_ufunc(self):
+        a = IndexedArray([1, 0, 1, 2, 2, 0], numpy.array([1.5, 2.5, 3.5]))
+        assert (a * 2).tolist() == [5.0, 3.0, 5.0, 7.0, 7.0, 3.0]
+        assert (a == 2.5).tolist() == [True, False, True, False, False, False]
+        b = IndexedArray([1, 0, 1, 2], StringArray.fromiter(["one", "two", "three"]))
+        assert (b == "two").tolist() == [True, False, True, False]
+
+    def test_sparse_ufunc_nonfinite(self):
+        a = SparseArray(5, [1, 3], [numpy.inf, 2.0])
+        b = SparseArray(5, [3], [2.0])
+        with numpy.errstate(invalid="ignore"):
+            c = a * b
+        assert numpy.isnan(c.dense[1])
+        assert c.dense[3] == 4.0
+        assert c.dense[[0, 2, 4]].tolist() == [0.0, 0.0, 0.0]
+        c = SparseArray(5, [1, 3], [7, 2])
+        d = SparseArray(5, [3], [2])
+        assert (c * d).index.tolist() == [3]
+
+    def test_sparse_fromcoo_bounds(self):
+        self.assertRaises(ValueError, lambda: SparseArray.fromcoo(5, [1, 5], [1.1, 2.2]))
+        self.assertRaises(ValueError, lambda: SparseArray.fromcoo(5, [-1, 2], [1.1, 2.2]))
+        a = SparseArray.fromcoo(5, [4, 0], [1.1, 2.2])
+        self.assertRaises(ValueError, lambda: a.merge([7], [3.3]))
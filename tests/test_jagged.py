@@ -69,6 +69,24 @@ class Test(unittest.TestCase):
         a = JaggedArray([0, 3, 3, 5], [3, 3, 5, 10], [[0.0], [1.1], [2.2], [3.3], [4.4], [5.5], [6.6], [7.7], [8.8], [9.9]])
         assert a.type == ArrayType(4, numpy.inf, 1, float)
 
+    def test_jagged_fromiter(self):
+        a = JaggedArray.fromiter([[1, 2], [], [3]])
+        assert a.content.dtype == numpy.dtype(numpy.int64)
+        assert JaggedArray.fromiter([[1, 2.5], [], [3]]).tolist() == [[1.0, 2.5], [], [3.0]]
+        a = JaggedArray.fromiter(iter([[1, 2], [], [3]]), dtype=numpy.float32)
+        assert a.content.dtype == numpy.dtype(numpy.float32)
+        assert a.tolist() == [[1.0, 2.0], [], [3.0]]
+        assert JaggedArray.fromiter([numpy.arange(3), numpy.arange(0), numpy.arange(2)]).tolist() == [[0, 1, 2], [], [0, 1]]
+        assert JaggedArray.fromiter([]).tolist() == []
+
+    def test_bytejagged_fromiter(self):
+        a = ByteJaggedArray.fromiter([b"ab", b"", b"c"])
+        assert a.subdtype == numpy.dtype(numpy.uint8)
+        assert a.tolist() == [[97, 98], [], [99]]
+        a = ByteJaggedArray.fromiter([numpy.array([1.5, 2.5], numpy.float32), numpy.array([], numpy.float32)])
+        assert a.subdtype == numpy.dtype(numpy.float32)
+        assert a.tolist() == [[1.5, 2.5], []]
+
     def test_jagged_fromindex(self):
         a = JaggedArray.fromindex([0, 1, 0, 0, 0, 1, 2, 0, 1, 0], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])
         self.assertEqual(a.tolist(), [[0.0, 1.1], [2.2], [3.3], [4.4, 5.5, 6.6], [7.7, 8.8], [9.9]])
@@ -128,7 +128,70 @@ class Test(unittest.TestCase):
         a = BitMaskedArray.fromboolmask([True, True, False, True, False, True, True, True, False, True, False, True], [0, 1, 999, 2, 999, 3, 0, 1, 999, 2, 999, 3], maskedwhen=False, lsborder=True)
         assert a.tolist() == [0, 1, None, 2, None, 3, 0, 1, None, 2, None, 3]
 
+    def test_bitmasked_slice(self):
+        boolmask = [True, False, False, True, True, False, True, False, True, True, False, True, False, False, True, True, False, True, False, True]
+        content = list(range(20))
+        expected = [None if m else x for m, x in zip(boolmask, content)]
+        for lsborder in (True, False):
+            a = BitMaskedArray.fromboolmask(boolmask, content, maskedwhen=True, lsborder=lsborder)
+            assert list(a) == expected
+            for where in [slice(3, None), slice(8, 17), slice(5, 6), slice(9, 3), slice(None, None, 3), slice(18, 2, -2), slice(None, None, -1)]:
+                assert a[where].tolist() == expected[where]
+                assert list(a[where]) == expected[where]
+            assert a[3:][5:12].tolist() == expected[3:][5:12]
+
+    def test_bitmasked_ufunc(self):
+        a = BitMaskedArray.fromboolmask([True, False, True, False, True, False, True, False, True, False], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9], maskedwhen=True, lsborder=True)
+        b = BitMaskedArray.fromboolmask([False, False, False, False, False, True, True, True, True, True], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9], maskedwhen=False, lsborder=False)
+        assert isinstance(a + b, BitMaskedArray)
+        assert (a + b).tolist() == [None, None, None, None, None, 11.0, None, 15.4, None, 19.8]
+        assert (b + a).tolist() == [None, None, None, None, None, 11.0, None, 15.4, None, 19.8]
+        assert (a + numpy.array([0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9])).tolist() == [None, 2.2, None, 6.6, None, 11.0, None, 15.4, None, 19.8]
+        assert (a + IndexedMaskedArray([-1, -1, -1, 1, -1, 2, -1, 4, -1, 3], [0.0, 1.1, 2.2, 3.3, 4.4])).tolist() == [None, None, None, 4.4, None, 7.7, None, 12.100000000000001, None, 13.2]
+
+    def test_masked_dropna(self):
+        a = MaskedArray([True, False, True, False, True, False], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5], maskedwhen=True)
+        assert a.dropna().tolist() == [1.1, 3.3, 5.5]
+        assert a.fillna(-1).tolist() == [-1, 1.1, -1, 3.3, -1, 5.5]
+
+        a = BitMaskedArray.fromboolmask([True, False, True, False, True, False], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5], maskedwhen=True, lsborder=True)
+        assert a.dropna().tolist() == [1.1, 3.3, 5.5]
+        assert a.fillna(-1).tolist() == [-1, 1.1, -1, 3.3, -1, 5.5]
+
+        a = IndexedMaskedArray([-1, 0, -1, 1, -1, 2, -1, 4, -1, 3], [0.0, 1.1, 2.2, 3.3, 4.4])
+        assert a.dropna().tolist() == [0.0, 1.1, 2.2, 4.4, 3.3]
+        assert a.fillna(-1).tolist() == [-1, 0.0, -1, 1.1, -1, 2.2, -1, 4.4, -1, 3.3]
+
+    def test_masked_dropna_jagged(self):
+        content = JaggedArray.fromcounts([2, 0, 3, 1], [1.1, 2.2, 3.3, 4.4, 5.5, 6.6])
+        a = MaskedArray([False, True, False, True], content, maskedwhen=True)
+        assert a.dropna().tolist() == [[1.1, 2.2], [3.3, 4.4, 5.5]]
+        assert a.dropna().offsets.tolist() == [0, 2, 5]
+        a = IndexedMaskedArray([2, -1, 0, 3], content)
+        assert a.dropna().tolist() == [[3.3, 4.4, 5.5], [1.1, 2.2], [6.6]]
+        assert a.dropna().offsets.tolist() == [0, 3, 5, 6]
+
     def test_indexedmasked_get(self):
         a = IndexedMaskedArray([-1, 0, -1, 1, -1, 2, -1, 4, -1, 3], [0.0, 1.1, 2.2, 3.3, 4.4])
         assert a.tolist() == [None, 0.0, None, 1.1, None, 2.2, None, 4.4, None, 3.3]
         assert [a[i] for i in range(len(a))] == [None, 0.0, None, 1.1, None, 2.2, None, 4.4, None, 3.3]
+
+    def test_indexedmasked_compact(self):
+        a = IndexedMaskedArray([-1, 0, -1, 1, -1, 2, -1, 4, -1, 3], [0.0, 1.1, 2.2, 3.3, 4.4])[[9, 8, 7, 1]]
+        b = a.compact()
+        assert b.mask.tolist() == [0, -1, 1, 2]
+        assert b.content.tolist() == [3.3, 4.4, 0.0]
+        assert b.tolist() == a.tolist() == [3.3, None, 4.4, 0.0]
+
+    def test_masked_fillna_structured(self):
+        content = JaggedArray.fromcounts([2, 0, 3], [1.1, 2.2, 3.3, 4.4, 5.5])
+        assert MaskedArray([False, True, False], content).fillna([]).tolist() == [[1.1, 2.2], [], [3.3, 4.4, 5.5]]
+        assert IndexedMaskedArray([-1, 2, 0], content).fillna([9.9]).tolist() == [[9.9], [3.3, 4.4, 5.5], [1.1, 2.2]]
+        ints = JaggedArray.fromcounts([1, 1], [1, 2])
+        assert MaskedArray([False, True], ints).fillna([7.5]).tolist() == [[1.0], [7.5]]
+        assert MaskedArray([False, True], ints).fillna([]).content.dtype == ints.content.dtype
+        table = Table(x=[1, 2, 3], y=[1.1, 2.2, 3.3])
+        assert IndexedMaskedArray([2, -1, 0], table).fillna({"x": -1, "y": 0.0}).tolist() == [{"x": 3, "y": 3.3}, {"x": -1, "y": 0.0}, {"x": 1, "y": 1.1}]
+        assert MaskedArray([True, False, False], table).fillna(0).tolist() == [{"x": 0, "y": 0.0}, {"x": 2, "y": 2.2}, {"x": 3, "y": 3.3}]
+        strings = StringArray.fromiter(["one", "two"])
+        assert IndexedMaskedArray([1, -1, 0], strings).fillna("").tolist() == ["two", "", "one"]
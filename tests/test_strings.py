@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2018, DIANA-HEP
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# 
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# 
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+import numpy
+
+from awkward import *
+
+class Test(unittest.TestCase):
+    def runTest(self):
+        pass
+
+    def test_strings_equal_literal(self):
+        a = StringArray.fromiter(["one", "two", "three", "two", ""])
+        assert (a == "two").tolist() == [False, True, False, True, False]
+        assert ("two" != a).tolist() == [True, False, True, False, True]
+        assert (a == "").tolist() == [False, False, False, False, True]
+        assert (a == b"one").tolist() == [True, False, False, False, False]
+
+    def test_strings_categorize(self):
+        a = StringArray.fromiter(["one", "two", "three", "two", "", "one"])
+        b = a.categorize()
+        assert isinstance(b, IndexedArray)
+        assert b.index.tolist() == [0, 1, 2, 1, 3, 0]
+        assert b.content.tolist() == ["one", "two", "three", ""]
+        assert (b == "two").tolist() == [False, True, False, True, False, False]
+
+    def test_strings_length(self):
+        a = StringArray.fromiter(["Hello", "wörld", "", "hell"])
+        assert a.bytelength().tolist() == [5, 6, 0, 4]
+        assert a.length().tolist() == [5, 5, 0, 4]
+
+    def test_strings_search(self):
+        a = StringArray.fromiter(["Hello", "wörld", "", "hell", "shell oh"])
+        assert a.startswith("hel").tolist() == [False, False, False, True, False]
+        assert a.endswith("ll").tolist() == [False, False, False, True, False]
+        assert a.contains("ell").tolist() == [True, False, False, True, True]
+        assert a.contains("ö").tolist() == [False, True, False, False, False]
+        assert a[::-1].contains("h").tolist() == [True, True, False, False, False]
+
+    def test_strings_case(self):
+        a = StringArray.fromiter(["Hello", "wörld", ""])
+        assert a.lower().tolist() == ["hello", "wörld", ""]
+        assert a.upper().tolist() == ["HELLO", "WöRLD", ""]
+
+    def test_strings_concatenate(self):
+        a = StringArray.fromiter(["one", "", "three"])
+        assert (a + "!").tolist() == ["one!", "!", "three!"]
+        assert ("<" + a).tolist() == ["<one", "<", "<three"]
+        assert (a + a[::-1]).tolist() == ["onethree", "", "threeone"]
+
+    def test_strings_hash(self):
+        a = StringArray.fromiter(["one", "two", "one", ""])
+        h = a.hash()
+        assert h.dtype == numpy.uint64
+        assert h[0] == h[2] and h[0] != h[1]
+        assert a[[2, 1]].hash().tolist() == [h[2], h[1]]
+
+    def test_strings_fromstr(self):
+        assert StringArray.fromstr(3, "hé").tolist() == ["hé", "hé", "hé"]
+        assert StringArray.fromstr(2, "").tolist() == ["", ""]
+        assert StringArray.fromstr(0, "x").tolist() == []
+
+    def test_strings_fromiter(self):
+        data = ["one", "wörld", "", "ñ€𝄞x"]
+        assert StringArray.fromiter(data).tolist() == data
+        assert StringArray.fromiter(data, encoding="utf-32le").tolist() == data
+        assert StringArray.fromiter(data, encoding="utf-16").tolist() == data
+        assert StringArray.fromiter([x.encode("utf-8") for x in data], encoding=None).tolist() == [x.encode("utf-8") for x in data]
+        assert StringArray.fromiter(data).counts.tolist() == [3, 6, 0, 10]
+
+    def test_strings_argsort(self):
+        data = ["b", "", "abcdefgh", "a\x00", "a", "é", "abc"]
+        a = StringArray.fromiter(data)
+        assert a.argsort().tolist() == sorted(range(len(data)), key=lambda i: data[i].encode("utf-8"))
+        assert a._sortgroups(width=2)[0].tolist() == a.argsort().tolist()
+        assert a.sort().tolist() == ["", "a", "a\x00", "abc", "abcdefgh", "b", "é"]
+
+    def test_strings_unique(self):
+        a = StringArray.fromiter(["two", "one", "two", "", "one"])
+        uniques, index, inverse = a.unique(return_index=True, return_inverse=True)
+        assert uniques.tolist() == ["", "one", "two"]
+        assert index.tolist() == [3, 1, 0]
+        assert inverse.tolist() == [2, 1, 2, 0, 1]
+        assert IndexedArray(inverse, uniques).tolist() == a.tolist()
+        assert StringArray.fromiter([]).unique().tolist() == []
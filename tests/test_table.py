@@ -165,3 +165,91 @@ class Test(unittest.TestCase):
     def test_virtual_table(self):
         a = VirtualArray(lambda: Table([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], [0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9]))
         assert a.tolist() == [{"0": 0, "1": 0.0}, {"0": 1, "1": 1.1}, {"0": 2, "1": 2.2}, {"0": 3, "1": 3.3}, {"0": 4, "1": 4.4}, {"0": 5, "1": 5.5}, {"0": 6, "1": 6.6}, {"0": 7, "1": 7.7}, {"0": 8, "1": 8.8}, {"0": 9, "1": 9.9}]
+
+    def test_table_tolist(self):
+        a = Table(x=[0, 1, 2, 3, 4], y=JaggedArray.fromcounts([1, 0, 2, 0, 1], [1.1, 2.2, 3.3, 4.4]))
+        assert a.tolist() == [{"x": 0, "y": [1.1]}, {"x": 1, "y": []}, {"x": 2, "y": [2.2, 3.3]}, {"x": 3, "y": []}, {"x": 4, "y": [4.4]}]
+        assert a[1::2].tolist() == [{"x": 1, "y": []}, {"x": 3, "y": []}]
+        assert a[[4, 0]].tolist() == [{"x": 4, "y": [4.4]}, {"x": 0, "y": [1.1]}]
+        assert [tuple(x) for x in a[::2].itertuples(blocksize=2)] == [(0, [1.1]), (2, [2.2, 3.3]), (4, [4.4])]
+        assert [x.x for x in a.itertuples()] == [0, 1, 2, 3, 4]
+
+    def test_table_torec(self):
+        rec = numpy.array([(1, 1.1), (2, 2.2), (3, 3.3)], dtype=[("x", numpy.int32), ("y", numpy.float64)])
+        a = Table.fromrec(rec)
+        assert a.torec().tolist() == rec.tolist()
+        assert numpy.shares_memory(a.torec(), rec)
+        assert numpy.shares_memory(a[::2].torec(), rec)
+        assert a[::2].torec().tolist() == [(1, 1.1), (3, 3.3)]
+        b = Table(x=numpy.array([1, 2, 3]), y=numpy.array([1.1, 2.2, 3.3]))
+        assert b.torec().tolist() == rec.tolist()
+        assert b.torec().dtype.names == ("x", "y")
+        self.assertRaises(TypeError, lambda: Table(x=JaggedArray.fromcounts([1], [1])).torec())
+
+    def test_table_fromrec_copy(self):
+        rec = numpy.array([(1, 1.1), (2, 2.2), (3, 3.3)], dtype=[("x", numpy.int8), ("y", numpy.float64)])
+        a = Table.fromrec(rec)
+        assert numpy.shares_memory(a["x"], rec)
+        b = Table.fromrec(rec, copy=True)
+        assert not numpy.shares_memory(b["x"], rec)
+        assert b["x"].flags.c_contiguous
+        assert b.tolist() == a.tolist()
+
+    def test_table_torec_layout(self):
+        rec = numpy.array([(1, 1.1), (2, 2.2), (3, 3.3)], dtype=[("x", numpy.int8), ("y", numpy.float64)])
+        a = Table.fromrec(rec)
+        assert numpy.shares_memory(a.torec(aligned=False), rec)
+        assert a.torec(aligned=False).dtype.itemsize == 9
+        aligned = a.torec(aligned=True)
+        assert not numpy.shares_memory(aligned, rec)
+        assert aligned.dtype.isalignedstruct
+        assert aligned.dtype.itemsize == 16
+        assert aligned.tolist() == rec.tolist()
+        rec2 = numpy.array(rec.tolist(), dtype=numpy.dtype([("x", numpy.int8), ("y", numpy.float64)], align=True))
+        assert numpy.shares_memory(Table.fromrec(rec2).torec(aligned=True), rec2)
+
+    def test_table_compose_views(self):
+        a = Table(x=numpy.arange(10), y=numpy.arange(10) * 1.1)
+        b = a[1::2]
+        assert b._view == (1, 2, 5)
+        c = b[numpy.array([True, False, True, False, True])]
+        assert c._view.tolist() == [1, 5, 9]
+        assert c["x"].tolist() == [1, 5, 9]
+        d = b[[-1, 0]]
+        assert d._view.tolist() == [9, 1]
+        assert d["x"].tolist() == [9, 1]
+        index = numpy.array([-1, 0])
+        b[index]
+        assert index.tolist() == [-1, 0]
+        assert (c == c).tolist() == [True, True, True]
+        a["x"][5] = 50
+        assert c["x"].tolist() == [1, 50, 9]
+        y = numpy.arange(10) * 1.1
+        y.flags.writeable = False
+        e = Table(x=numpy.arange(10), y=y)[[3, 1]]
+        assert e["y"] is e["y"]
+        assert e[["y"]]["y"] is e["y"]
+        assert e[[1]]["y"] is not e["y"]
+
+    def test_table_lazy_ufunc(self):
+        import awkward.type
+        materialized = []
+        def generate(name):
+            materialized.append(name)
+            return numpy.arange(5) * 1.5
+        a = Table(dict((n, VirtualArray(generate, (n,), type=awkward.type.ArrayType(5, numpy.dtype(numpy.float64)))) for n in ["x", "y", "z"]))
+        b = a * 2
+        assert materialized == []
+        assert len(b) == 5
+        assert isinstance(b["x"], VirtualArray)
+        assert b["y"].tolist() == [0.0, 3.0, 6.0, 9.0, 12.0]
+        assert materialized == ["y"]
+        assert (a[1::2] + 1)["z"].tolist() == [2.5, 5.5]
+        assert materialized == ["y", "z"]
+        assert (a[["x"]] > 2).tolist() == [False, False, True, True, True]
+        assert materialized == ["y", "z", "x"]
+
+    def test_table_tuple_ufunc(self):
+        quotient, remainder = numpy.divmod(Table(x=numpy.arange(5)), 2)
+        assert quotient["x"].tolist() == [0, 0, 1, 1, 2]
+        assert remainder["x"].tolist() == [0, 1, 0, 1, 0]
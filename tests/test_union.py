@@ -61,3 +61,45 @@ class Test(unittest.TestCase):
         b = UnionArray.fromtags([1, 1, 0, 1, 0], [[10.1, 20.2], [123, 456, 789]])
         assert (a + a).tolist() == [200, 2.2, 4.4, 400, 600]
         assert (a + b).tolist() == [223, 457.1, 12.3, 989, 320.2]
+
+    def test_union_bulk(self):
+        a = UnionArray.fromtags([0, 1, 1, 0, 0], [[100, 200, 300], [1.1, 2.2]])
+        assert a.tolist() == [100, 1.1, 2.2, 200, 300]
+        assert list(a) == [100, 1.1, 2.2, 200, 300]
+        a._iterblocksize = 2
+        assert list(a) == [100, 1.1, 2.2, 200, 300]
+        assert a.dense.dtype == numpy.dtype(numpy.float64)
+        assert a.dense.tolist() == [100, 1.1, 2.2, 200, 300]
+        assert a._uniquetags().tolist() == [0, 1]
+        assert a.any() and a.all()
+        b = UnionArray.fromtags([1, 0, 1], [Table(x=[1]), JaggedArray.fromcounts([0, 2], [1, 2])])
+        assert b.tolist() == [[], {"x": 1}, [1, 2]]
+        self.assertRaises(TypeError, lambda: b.dense)
+
+    def test_union_simplify(self):
+        a = UnionArray([0, 1, 2, 1, 0], [0, 0, 1, 1, 2], [numpy.array([1.1, 2.2, 3.3]), numpy.array([10.0, 20.0]), numpy.array([7, 8])])
+        b = a.simplify()
+        assert isinstance(b, UnionArray)
+        assert len(b.contents) == 2
+        assert b.contents[0].tolist() == [1.1, 3.3, 10.0, 20.0]
+        assert b.contents[1].tolist() == [8]
+        assert b.tolist() == a.tolist()
+        assert b.issequential is False
+        c = a[[0, 1, 3]]
+        assert isinstance(c, UnionArray) and c.contents is a.contents
+        assert isinstance(c.simplify(), numpy.ndarray)
+        assert c.simplify().tolist() == [1.1, 10.0, 20.0]
+        d = a[[2, 4]].simplify()
+        assert isinstance(d, UnionArray)
+        assert [len(x) for x in d.contents] == [1, 1]
+        assert d.tolist() == [8, 3.3]
+        assert a[1:3].contents is a.contents
+        e = UnionArray.fromtags([1, 1], [numpy.arange(3), numpy.array([1.1, 2.2])]).simplify()
+        assert isinstance(e, numpy.ndarray)
+        assert e.tolist() == [1.1, 2.2]
+        f = UnionArray.fromtags([1, 1], [numpy.arange(3), JaggedArray.fromcounts([2, 1], [1, 2, 3])]).simplify()
+        assert isinstance(f, JaggedArray)
+        assert f.tolist() == [[1, 2], [3]]
+        g = UnionArray([1, 1], [1, 0], [numpy.arange(3), Table(x=[1.1, 2.2])]).simplify()
+        assert isinstance(g, Table)
+        assert g.tolist() == [{"x": 2.2}, {"x": 1.1}]